@@ -0,0 +1,19 @@
+"""
+Import bootstrap for the Streamlit app.
+
+Streamlit puts the app directory on sys.path, so every script
+can `import _bootstrap` to make the project root (and with it
+the `src` package) importable. The insert is guarded so repeated
+reruns leave sys.path untouched.
+
+Author: Koushik
+Date: February 2026
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
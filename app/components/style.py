@@ -0,0 +1,280 @@
+"""
+Shared page styles for the Streamlit app.
+
+Holds the stylesheet of every page as a module constant
+and a single helper to inject one into the current page.
+
+Author: Koushik
+Date: February 2026
+"""
+
+from functools import lru_cache
+
+import streamlit as st
+
+
+@lru_cache(maxsize=None)
+def _style_tag(css: str) -> str:
+    """Wrap a stylesheet in a <style> tag, built once per stylesheet."""
+    return f"<style>{css}</style>"
+
+
+def inject(css: str):
+    """Inject a stylesheet into the current page without markdown parsing."""
+    st.html(_style_tag(css))
+
+
+APP_CSS = """
+.main-header {
+    background: linear-gradient(135deg, #1a73e8, #0d47a1);
+    color: white;
+    padding: 20px 30px;
+    border-radius: 12px;
+    margin-bottom: 20px;
+    text-align: center;
+}
+.main-header h1 {
+    margin: 0;
+    font-size: 2.2em;
+}
+.main-header p {
+    margin: 5px 0 0 0;
+    opacity: 0.85;
+    font-size: 1em;
+}
+.stat-card {
+    background: white;
+    border-radius: 12px;
+    padding: 20px;
+    text-align: center;
+    box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+    border-top: 4px solid #1a73e8;
+}
+.stat-card h3 {
+    margin: 0;
+    color: #1a73e8;
+    font-size: 1.8em;
+}
+.stat-card p {
+    margin: 5px 0 0 0;
+    color: #555;
+    font-size: 0.9em;
+}
+.stat-grid {
+    display: grid;
+    grid-template-columns: repeat(4, 1fr);
+    gap: 16px;
+}
+.section-box {
+    background: #f8fbff;
+    border-radius: 10px;
+    padding: 20px;
+    margin-bottom: 15px;
+    border: 1px solid #e0ecff;
+}
+.success-box {
+    background: #e8f5e9;
+    border-radius: 10px;
+    padding: 15px 20px;
+    border: 1px solid #c8e6c9;
+    color: #2e7d32;
+}
+.warning-box {
+    background: #fff3e0;
+    border-radius: 10px;
+    padding: 15px 20px;
+    border: 1px solid #ffe0b2;
+    color: #e65100;
+}
+.entity-tag {
+    display: inline-block;
+    padding: 4px 12px;
+    border-radius: 20px;
+    font-size: 0.85em;
+    margin: 3px;
+}
+.tag-symptom { background: #ffcdd2; color: #c62828; }
+.tag-treatment { background: #c8e6c9; color: #2e7d32; }
+.tag-diagnosis { background: #bbdefb; color: #1565c0; }
+.tag-keyword { background: #e1bee5; color: #6a1b9a; }
+.stButton button {
+    background-color: #1a73e8;
+    color: white;
+    border: none;
+    padding: 12px 30px;
+    border-radius: 8px;
+    font-size: 1em;
+    cursor: pointer;
+    width: 100%;
+}
+.stButton button:hover {
+    background-color: #1558b0;
+}
+sidebar .stButton button {
+    background-color: #0d47a1;
+}
+"""
+
+
+ANALYSIS_CSS = """
+.page-header {
+    background: linear-gradient(135deg, #1a73e8, #0d47a1);
+    color: white;
+    padding: 18px 28px;
+    border-radius: 12px;
+    margin-bottom: 20px;
+}
+.page-header h2 { margin: 0; }
+.page-header p { margin: 4px 0 0; opacity: 0.85; }
+.entity-tag { display: inline-block; padding: 5px 14px; border-radius: 20px; font-size: 0.88em; margin: 3px; }
+.tag-symptom { background: #ffcdd2; color: #c62828; }
+.tag-treatment { background: #c8e6c9; color: #2e7d32; }
+.tag-diagnosis { background: #bbdefb; color: #1565c0; }
+.tag-keyword { background: #e1bee5; color: #6a1b9a; }
+.tag-anatomy { background: #fff9c4; color: #f57f17; }
+.info-card {
+    background: #f8fbff;
+    border-radius: 10px;
+    padding: 18px;
+    border: 1px solid #e0ecff;
+    margin-bottom: 12px;
+}
+.info-card h4 { margin: 0 0 8px; color: #1a73e8; }
+.confidence-high { color: #2e7d32; font-weight: bold; }
+.confidence-mid { color: #f57c00; font-weight: bold; }
+.confidence-low { color: #c62828; font-weight: bold; }
+"""
+
+
+SOAP_CSS = """
+.page-header {
+    background: linear-gradient(135deg, #4caf50, #2e7d32);
+    color: white;
+    padding: 18px 28px;
+    border-radius: 12px;
+    margin-bottom: 20px;
+}
+.page-header h2 { margin: 0; }
+.page-header p { margin: 4px 0 0; opacity: 0.85; }
+.soap-section {
+    border-radius: 10px;
+    padding: 18px 22px;
+    margin-bottom: 16px;
+}
+.soap-S { background: #e3f2fd; border-left: 5px solid #1a73e8; }
+.soap-O { background: #e8f5e9; border-left: 5px solid #4caf50; }
+.soap-A { background: #fff3e0; border-left: 5px solid #ff9800; }
+.soap-P { background: #f3e5f5; border-left: 5px solid #9c27b0; }
+.soap-section h3 { margin: 0 0 10px; }
+.soap-section p { margin: 6px 0; color: #444; }
+.soap-label { font-weight: bold; color: #333; }
+"""
+
+
+SENTIMENT_CSS = """
+.page-header {
+    background: linear-gradient(135deg, #9c27b0, #6a1b9a);
+    color: white;
+    padding: 18px 28px;
+    border-radius: 12px;
+    margin-bottom: 20px;
+}
+.page-header h2 { margin: 0; }
+.page-header p { margin: 4px 0 0; opacity: 0.85; }
+.sentiment-card {
+    border-radius: 10px;
+    padding: 14px 18px;
+    margin-bottom: 10px;
+}
+.sent-anxious { background: #ffebee; border-left: 4px solid #f44336; }
+.sent-neutral { background: #f5f5f5; border-left: 4px solid #9e9e9e; }
+.sent-reassured { background: #e8f5e9; border-left: 4px solid #4caf50; }
+.sentiment-card .statement { color: #444; font-style: italic; margin: 6px 0 0; }
+.sentiment-card .meta { font-size: 0.82em; color: #777; margin-top: 4px; }
+.sentiment-card .confidence { color: #888; font-size: 0.85em; }
+.intent-badge {
+    background: #ede7f6;
+    color: #5e35b1;
+    padding: 2px 10px;
+    border-radius: 12px;
+    font-size: 0.82em;
+    margin-left: 8px;
+}
+.metric-row { display: flex; gap: 16px; }
+.metric-row > div { flex: 1; border-radius: 10px; padding: 16px; text-align: center; }
+.metric-row h2, .metric-row h3 { color: inherit; }
+.metric-row h3, .metric-row p { margin: 0; }
+.metric-row h2 { margin: 8px 0; }
+.metric-row p { color: #777; }
+"""
+
+
+ABOUT_CSS = """
+.page-header {
+    background: linear-gradient(135deg, #37474f, #263238);
+    color: white;
+    padding: 18px 28px;
+    border-radius: 12px;
+    margin-bottom: 20px;
+}
+.page-header h2 { margin: 0; }
+.page-header p { margin: 4px 0 0; opacity: 0.85; }
+.tech-card {
+    background: #f8fbff;
+    border-radius: 10px;
+    padding: 16px;
+    border: 1px solid #e0ecff;
+    text-align: center;
+}
+.tech-card h4 { margin: 8px 0 4px; color: #1a73e8; }
+.tech-card p { margin: 0; color: #666; font-size: 0.88em; }
+.step-box {
+    background: white;
+    border-radius: 10px;
+    padding: 16px 20px;
+    margin-bottom: 10px;
+    box-shadow: 0 2px 6px rgba(0,0,0,0.08);
+    display: flex;
+    align-items: flex-start;
+    gap: 14px;
+}
+.step-number {
+    background: #1a73e8;
+    color: white;
+    width: 32px;
+    height: 32px;
+    border-radius: 50%;
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    font-weight: bold;
+    flex-shrink: 0;
+}
+.metric-card {
+    background: #f8fbff;
+    border-radius: 10px;
+    padding: 18px;
+    text-align: center;
+    border: 1px solid #e0ecff;
+}
+.metric-card h3 { margin: 0; color: #1a73e8; }
+.metric-card p { margin: 4px 0 0; color: #666; font-size: 0.88em; }
+.grid-4 { display: grid; grid-template-columns: repeat(4, 1fr); gap: 16px; }
+.grid-2 { display: grid; grid-template-columns: repeat(2, 1fr); gap: 16px; }
+.overview-box {
+    background: #f8fbff;
+    border-radius: 10px;
+    padding: 18px;
+    border: 1px solid #e0ecff;
+}
+.overview-box p { margin: 0; color: #444; line-height: 1.6; }
+.module-card {
+    background: #f8fbff;
+    border-radius: 8px;
+    padding: 12px 16px;
+    margin-bottom: 8px;
+    border: 1px solid #e0ecff;
+}
+.module-card strong { color: #1a73e8; }
+.module-card span { color: #666; font-size: 0.88em; }
+"""
@@ -10,13 +10,13 @@ Date: February 2026
 """
 
 import streamlit as st
-import json
-import os
-import sys
+import io
 import warnings
-import time
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import _bootstrap  # noqa: F401
+from app.components.style import inject, APP_CSS
+from src.config import PROCESSING_CONFIG, DATA_RAW
+from src.utils import dumps_json
 
 warnings.filterwarnings('ignore')
 
@@ -30,122 +30,134 @@ st.set_page_config(
     }
 )
 
+SAMPLE_PATH = DATA_RAW / 'sample_transcript.txt'
 
-def load_css():
-    """Load custom CSS styles."""
-    st.markdown("""
-        <style>
-            .main-header {
-                background: linear-gradient(135deg, #1a73e8, #0d47a1);
-                color: white;
-                padding: 20px 30px;
-                border-radius: 12px;
-                margin-bottom: 20px;
-                text-align: center;
-            }
-            .main-header h1 {
-                margin: 0;
-                font-size: 2.2em;
-            }
-            .main-header p {
-                margin: 5px 0 0 0;
-                opacity: 0.85;
-                font-size: 1em;
-            }
-            .stat-card {
-                background: white;
-                border-radius: 12px;
-                padding: 20px;
-                text-align: center;
-                box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-                border-top: 4px solid #1a73e8;
-            }
-            .stat-card h3 {
-                margin: 0;
-                color: #1a73e8;
-                font-size: 1.8em;
-            }
-            .stat-card p {
-                margin: 5px 0 0 0;
-                color: #555;
-                font-size: 0.9em;
-            }
-            .section-box {
-                background: #f8fbff;
-                border-radius: 10px;
-                padding: 20px;
-                margin-bottom: 15px;
-                border: 1px solid #e0ecff;
-            }
-            .success-box {
-                background: #e8f5e9;
-                border-radius: 10px;
-                padding: 15px 20px;
-                border: 1px solid #c8e6c9;
-                color: #2e7d32;
-            }
-            .warning-box {
-                background: #fff3e0;
-                border-radius: 10px;
-                padding: 15px 20px;
-                border: 1px solid #ffe0b2;
-                color: #e65100;
-            }
-            .entity-tag {
-                display: inline-block;
-                padding: 4px 12px;
-                border-radius: 20px;
-                font-size: 0.85em;
-                margin: 3px;
-            }
-            .tag-symptom { background: #ffcdd2; color: #c62828; }
-            .tag-treatment { background: #c8e6c9; color: #2e7d32; }
-            .tag-diagnosis { background: #bbdefb; color: #1565c0; }
-            .tag-keyword { background: #e1bee5; color: #6a1b9a; }
-            .stButton button {
-                background-color: #1a73e8;
-                color: white;
-                border: none;
-                padding: 12px 30px;
-                border-radius: 8px;
-                font-size: 1em;
-                cursor: pointer;
-                width: 100%;
-            }
-            .stButton button:hover {
-                background-color: #1558b0;
-            }
-            sidebar .stButton button {
-                background-color: #0d47a1;
-            }
-        </style>
-    """, unsafe_allow_html=True)
+STAGE_MESSAGES = {
+    "cleaning": "🧹 Cleaning text...",
+    "diarization": "🗣️ Parsing speakers...",
+    "ner": "🔍 Extracting entities...",
+    "temporal": "📅 Extracting temporal info...",
+    "sentiment": "😊 Analyzing sentiment...",
+    "intent": "🎯 Classifying intents...",
+    "summary": "📝 Generating reports...",
+}
 
 
+@st.cache_data(show_spinner=False)
 def load_sample_transcript():
-    """Load the sample transcript from data/raw/."""
-    sample_path = os.path.join(
-        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-        'data', 'raw', 'sample_transcript.txt'
-    )
-    if os.path.exists(sample_path):
-        with open(sample_path, 'r') as f:
-            return f.read()
-    return None
+    """Load the sample transcript from data/raw/ (read once per process)."""
+    try:
+        return SAMPLE_PATH.read_text(encoding='utf-8')
+    except FileNotFoundError:
+        return None
+
+
+@st.cache_resource(show_spinner="🔄 Loading NLP models... (first time only)")
+def _get_pipeline():
+    """Load the NLP pipeline once per server process, shared by all sessions."""
+    from src.pipeline.medical_nlp_pipeline import MedicalNLPPipeline
+    return MedicalNLPPipeline()
+
+
+_RESULT_CACHE_SIZE = 16
+
+
+def _run_pipeline(text: str, ner: bool, sentiment: bool, intent: bool, on_stage=None):
+    """
+    Run the pipeline once per transcript and option set.
+
+    Results are kept in session state rather than st.cache_data: the
+    progress callback writes to an element created by the caller, which a
+    cached function may not touch, and a cache hit would never report
+    progress anyway. on_stage is only called when the pipeline runs.
+    """
+    cache = st.session_state.setdefault('_pipeline_results', {})
+    key = (text, ner, sentiment, intent)
+
+    output = cache.pop(key, None)
+    if output is None:
+        output = _get_pipeline().process(
+            text,
+            on_stage=on_stage,
+            ner=ner,
+            sentiment=sentiment,
+            intent=intent,
+        )
+        if len(cache) >= _RESULT_CACHE_SIZE:
+            # Drop the least recently used result (dicts keep insertion order)
+            del cache[next(iter(cache))]
+
+    cache[key] = output
+    return output
+
+
+def _read_upload(uploaded_file):
+    """
+    Decode an uploaded transcript, stopping at the configured length cap.
+
+    Returns:
+        Tuple of (text, truncated)
+    """
+    max_length = PROCESSING_CONFIG['max_text_length']
+    uploaded_file.seek(0)
+    reader = io.TextIOWrapper(uploaded_file, encoding='utf-8-sig', errors='replace')
+    try:
+        text = reader.read(max_length + 1)
+    finally:
+        reader.detach()
+    return text[:max_length], len(text) > max_length
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _quick_stats(text: str):
+    """Count words, doctor turns and patient turns in a raw transcript."""
+    doctor_turns = patient_turns = 0
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        lower = line.lower()
+        if lower.startswith(('physician', 'doctor')):
+            doctor_turns += 1
+        elif lower.startswith('patient'):
+            patient_turns += 1
+    return len(text.split()), doctor_turns, patient_turns
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _preview(text: str, limit: int = 500) -> str:
+    """Return the first `limit` characters of a transcript for display."""
+    return text[:limit] + "\n..." if len(text) > limit else text
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _serialize_output(output) -> bytes:
+    """Serialize the pipeline output for download, once per result."""
+    return dumps_json(output)
+
+
+_STAT_CARD = '<div class="stat-card"><h3 style="color:{2};">{0}</h3><p>{1}</p></div>'
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _stat_cards_html(cards: tuple) -> str:
+    """Build the result stat cards from (value, label, colour) tuples."""
+    return '<div class="stat-grid">' + ''.join(_STAT_CARD.format(*card) for card in cards) + '</div>'
+
+
+def _render_stat_cards(cards: tuple):
+    """Render all result stat cards in a single markdown call."""
+    st.markdown(_stat_cards_html(cards), unsafe_allow_html=True)
 
 
 def initialize_pipeline():
     """Initialize the NLP pipeline (cached)."""
-    if 'pipeline' not in st.session_state:
-        with st.spinner("🔄 Loading NLP models... (first time only)"):
-            from src.pipeline.medical_nlp_pipeline import MedicalNLPPipeline
-            st.session_state['pipeline'] = MedicalNLPPipeline()
-    return st.session_state['pipeline']
+    return _get_pipeline()
 
 
 def main():
     """Main application layout and logic."""
-    load_css()
+    inject(APP_CSS)
 
     st.markdown("""
         <div class="main-header">
@@ -162,18 +174,20 @@ def main():
             help="Upload a doctor-patient conversation transcript"
         )
 
-        st.markdown("---")
+        st.divider()
         st.markdown("### 📋 Or Use Sample")
         load_sample = st.button("📄 Load Sample Transcript")
 
-        st.markdown("---")
+        st.divider()
         st.markdown("### ⚙️ Analysis Options")
-        run_ner = st.checkbox("Named Entity Recognition", value=True)
-        run_sentiment = st.checkbox("Sentiment Analysis", value=True)
-        run_intent = st.checkbox("Intent Classification", value=True)
-        run_soap = st.checkbox("SOAP Note Generation", value=True)
-
-        st.markdown("---")
+        with st.form("analysis_options", border=False):
+            run_ner = st.checkbox("Named Entity Recognition", value=True)
+            run_sentiment = st.checkbox("Sentiment Analysis", value=True)
+            run_intent = st.checkbox("Intent Classification", value=True)
+            run_soap = st.checkbox("SOAP Note Generation", value=True)
+            st.form_submit_button("✅ Apply Options")
+
+        st.divider()
         st.markdown("### 📊 Navigation")
         st.markdown("""
             - 🏠 **Home** - Upload & Process
@@ -186,9 +200,11 @@ def main():
     transcript_text = None
 
     if uploaded_file is not None:
-        transcript_text = uploaded_file.getvalue().decode("utf-8")
+        transcript_text, truncated = _read_upload(uploaded_file)
         st.session_state['raw_transcript'] = transcript_text
         st.markdown('<div class="success-box">✅ File uploaded successfully!</div>', unsafe_allow_html=True)
+        if truncated:
+            st.warning(f"⚠️ Transcript truncated to the first {PROCESSING_CONFIG['max_text_length']:,} characters.")
 
     elif load_sample:
         transcript_text = load_sample_transcript()
@@ -207,31 +223,26 @@ def main():
         with col1:
             st.markdown("### 📝 Transcript Preview")
             st.markdown('<div class="section-box">', unsafe_allow_html=True)
-            preview = transcript_text[:500] + "\n..." if len(transcript_text) > 500 else transcript_text
-            st.text(preview)
+            st.text(_preview(transcript_text))
             st.markdown('</div>', unsafe_allow_html=True)
 
         with col2:
             st.markdown("### 📊 Quick Stats")
-            lines = transcript_text.strip().split('\n')
-            non_empty_lines = [l for l in lines if l.strip()]
-            doctor_lines = [l for l in non_empty_lines if l.strip().lower().startswith(('physician', 'doctor'))]
-            patient_lines = [l for l in non_empty_lines if l.strip().lower().startswith('patient')]
-            word_count = len(transcript_text.split())
+            word_count, doctor_turns, patient_turns = _quick_stats(transcript_text)
 
             st.markdown(f"""
                 <div class="stat-card" style="margin-bottom:10px;">
                     <h3>{word_count}</h3><p>Total Words</p>
                 </div>
                 <div class="stat-card" style="margin-bottom:10px; border-top-color:#4caf50;">
-                    <h3>{len(doctor_lines)}</h3><p>Doctor Turns</p>
+                    <h3>{doctor_turns}</h3><p>Doctor Turns</p>
                 </div>
                 <div class="stat-card" style="margin-bottom:10px; border-top-color:#ff9800;">
-                    <h3>{len(patient_lines)}</h3><p>Patient Turns</p>
+                    <h3>{patient_turns}</h3><p>Patient Turns</p>
                 </div>
             """, unsafe_allow_html=True)
 
-        st.markdown("---")
+        st.divider()
         col_btn1, col_btn2 = st.columns(2)
 
         with col_btn1:
@@ -239,75 +250,41 @@ def main():
 
         with col_btn2:
             if 'pipeline_output' in st.session_state:
-                output_json = json.dumps(st.session_state['pipeline_output'], indent=2, default=str)
                 st.download_button(
                     label="📥 Download Results (JSON)",
-                    data=output_json,
+                    data=_serialize_output(st.session_state['pipeline_output']),
                     file_name="medical_nlp_results.json",
                     mime="application/json"
                 )
 
         if process_btn:
-            pipeline = initialize_pipeline()
+            initialize_pipeline()
 
             with st.spinner("🧠 Analyzing transcript... This may take a moment."):
                 progress_text = st.empty()
                 progress_text.markdown("🔄 Starting analysis...")
-                time.sleep(0.5)
-
-                progress_text.markdown("🔍 Extracting entities...")
-                time.sleep(0.3)
-
-                progress_text.markdown("😊 Analyzing sentiment...")
-                time.sleep(0.3)
 
-                progress_text.markdown("🎯 Classifying intents...")
-                time.sleep(0.3)
-
-                progress_text.markdown("📝 Generating reports...")
-
-                output = pipeline.process(transcript_text)
+                output = _run_pipeline(
+                    transcript_text,
+                    run_ner,
+                    run_sentiment,
+                    run_intent,
+                    on_stage=lambda name: progress_text.markdown(STAGE_MESSAGES[name]),
+                )
                 st.session_state['pipeline_output'] = output
+                st.session_state['run_soap'] = run_soap
 
                 progress_text.empty()
 
             st.markdown('<div class="success-box">✅ Analysis complete! Navigate to the pages on the left to see results.</div>', unsafe_allow_html=True)
 
-            col_s1, col_s2, col_s3, col_s4 = st.columns(4)
-
-            with col_s1:
-                entity_count = sum(len(v) for v in output.get('entities', {}).values())
-                st.markdown(f"""
-                    <div class="stat-card">
-                        <h3 style="color:#e53935;">{entity_count}</h3>
-                        <p>Entities Found</p>
-                    </div>
-                """, unsafe_allow_html=True)
-
-            with col_s2:
-                st.markdown(f"""
-                    <div class="stat-card">
-                        <h3 style="color:#7b1fa2;">{output['sentiment_analysis']['overall']['dominant_sentiment']}</h3>
-                        <p>Overall Sentiment</p>
-                    </div>
-                """, unsafe_allow_html=True)
-
-            with col_s3:
-                keyword_count = len(output.get('keywords', {}).get('medical_phrases', []))
-                st.markdown(f"""
-                    <div class="stat-card">
-                        <h3 style="color:#1565c0;">{keyword_count}</h3>
-                        <p>Medical Phrases</p>
-                    </div>
-                """, unsafe_allow_html=True)
-
-            with col_s4:
-                st.markdown(f"""
-                    <div class="stat-card">
-                        <h3 style="color:#2e7d32;">✓</h3>
-                        <p>SOAP Note Ready</p>
-                    </div>
-                """, unsafe_allow_html=True)
+            soap_value, soap_label = ('✓', 'SOAP Note Ready') if run_soap else ('—', 'SOAP Note Skipped')
+            _render_stat_cards((
+                (sum(map(len, output.get('entities', {}).values())), 'Entities Found', '#e53935'),
+                (output['sentiment_analysis']['overall']['dominant_sentiment'], 'Overall Sentiment', '#7b1fa2'),
+                (len(output.get('keywords', {}).get('medical_phrases', [])), 'Medical Phrases', '#1565c0'),
+                (soap_value, soap_label, '#2e7d32'),
+            ))
 
     else:
         st.markdown("""
@@ -32,10 +32,11 @@ MODELS_DIR = PROJECT_ROOT / 'models'
 # Logs directory
 LOGS_DIR = PROJECT_ROOT / 'logs'
 
-# Ensure directories exist
-DATA_OUTPUT.mkdir(parents=True, exist_ok=True)
-MODELS_DIR.mkdir(parents=True, exist_ok=True)
-LOGS_DIR.mkdir(parents=True, exist_ok=True)
+# Ensure directories exist (stat only; mkdir just on first run)
+for _directory in (DATA_OUTPUT, MODELS_DIR, LOGS_DIR):
+    if not _directory.is_dir():
+        _directory.mkdir(parents=True, exist_ok=True)
+del _directory
 
 
 # ============================================================================
@@ -47,6 +48,8 @@ MODELS = {
     'spacy_medical': 'en_core_sci_md',
     'sentiment': 'distilbert-base-uncased-finetuned-sst-2-english',
     'intent': 'facebook/bart-large-mnli',
+    'intent_encoder': 'sentence-transformers/all-MiniLM-L6-v2',
+    'keyword_encoder': 'sentence-transformers/all-MiniLM-L6-v2',
 }
 
 # Model-specific settings
@@ -54,6 +57,16 @@ MODEL_SETTINGS = {
     'sentiment_confidence_threshold': 0.7,
     'intent_confidence_threshold': 0.6,
     'ner_confidence_threshold': 0.5,
+    'sentiment_batch_size': 16,          # Statements per sentiment forward batch
+    'sentiment_cache_size': 1024,        # Memoized sentiment results (repeated utterances)
+    'sentiment_int8': False,             # Dynamic int8 quantization of the sentiment model (CPU)
+    'sentiment_sdpa': True,              # Fused scaled-dot-product attention when the model supports it
+    'torch_threads': None,               # Intra-op CPU threads for torch (None = torch default)
+    'intent_batch_size': 16,             # Statements per zero-shot forward batch
+    'intent_int8': False,                # Dynamic int8 quantization of the intent model (CPU)
+    'intent_fast_path': False,           # Try embedding similarity before zero-shot NLI
+    'intent_fast_path_margin': 0.15,     # Min cosine gap between top-2 labels to skip NLI
+    'intent_fast_path_temperature': 0.05, # Softmax temperature turning fast-path cosines into scores
 }
 
 
@@ -66,7 +79,13 @@ PROCESSING_CONFIG = {
     'max_text_length': 50000,            # Maximum characters to process
     'max_keywords': 15,                  # Maximum keywords to extract
     'keyword_ngram_range': (1, 3),       # Keyword phrase length (1-3 words)
+    'keyword_embedding_cache_size': 20000,  # Cached candidate n-gram embeddings (0 disables)
     'similarity_threshold': 0.7,         # For entity deduplication
+    'parallel_summary': True,            # Run independent summary extractors on a thread pool
+    'summary_workers': 4,                # Threads used when parallel_summary is on
+    'parallel_pipeline': True,           # Overlap independent pipeline stages on a thread pool
+    'pipeline_workers': 4,               # Threads used when parallel_pipeline is on
+    'use_re2': False,                    # Compile simple patterns with google-re2 when installed
 }
 
 # Sentiment labels mapping
@@ -18,6 +18,143 @@ from src.preprocessing import SpeakerDiarizer
 warnings.filterwarnings('ignore')
 
 
+_KEYWORD_GROUPS = {
+    'complaint': ('pain', 'discomfort', 'hurt', 'ache', 'problem', 'issue'),
+    'history': ('accident', 'happened', 'was', 'went', 'hit', 'started'),
+    'ros': ('anxiety', 'nervous', 'sleep', 'work', 'daily', 'emotional', 'concentrate'),
+    'exam': ('examination', 'range of movement', 'tenderness', 'looks good', 'condition'),
+    'exam_look': ('look', 'good'),
+    'observation': ('normal', 'good', 'full range', 'no sign', 'appears', 'noted'),
+    'treatment': ('treatment', 'therapy', 'physiotherapy', 'medication', 'recommend'),
+    'followup': ('follow-up', 'come back', 'return', 'reach out', 'if anything changes'),
+    'education': ('should', "don't", 'if', 'advised', 'important', 'make sure'),
+}
+
+
+def _build_keyword_scanner(groups: Dict[str, tuple]):
+    """
+    Compile every keyword group into one scanner.
+
+    The pattern is a zero-width lookahead over all keywords, longest first,
+    so it reports the longest keyword starting at each position. Shorter
+    keywords starting at the same position are prefixes of that one, so
+    each keyword maps to the categories of itself and all its prefixes.
+
+    Returns:
+        Tuple of (compiled pattern, keyword -> frozenset of categories)
+    """
+    categories = {}
+    for category, keywords in groups.items():
+        for keyword in keywords:
+            categories.setdefault(keyword, set()).add(category)
+
+    closure = {
+        keyword: frozenset().union(*(cats for prefix, cats in categories.items() if keyword.startswith(prefix)))
+        for keyword in categories
+    }
+    alternation = '|'.join(map(re.escape, sorted(categories, key=len, reverse=True)))
+    return re.compile(f'(?=({alternation}))'), closure
+
+
+_KEYWORD_SCAN_RE, _KEYWORD_CATEGORIES = _build_keyword_scanner(_KEYWORD_GROUPS)
+
+
+def _keyword_hits(lower: str) -> frozenset:
+    """Return the keyword categories present in a lowercased statement."""
+    return frozenset().union(*(_KEYWORD_CATEGORIES[m.group(1)] for m in _KEYWORD_SCAN_RE.finditer(lower)))
+
+
+# The transcript-level patterns below are lowercase and case-sensitive; they
+# run on an ASCII-lowered copy that keeps offsets aligned with the original,
+# so matched spans are sliced back out of the original text.
+_ASCII_LOWER = str.maketrans('ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')
+
+_EXAM_META_RE = re.compile(r'\[.*?[Ee]xam.*?\]')
+
+_VITAL_RES = [
+    re.compile(rf'{keyword}[:\s]+(.*?)(?:\.|,|$)')
+    for keyword in ('blood pressure', 'heart rate', 'temperature', 'oxygen')
+]
+
+_DIAGNOSIS_RES = [
+    re.compile(r'(?:diagnosed with|diagnosis[:\s]+|it was (?:a|an))\s+(.*?)(?:\.|,|$)'),
+    re.compile(r'(whiplash.*?)(?:\.|,|$)'),
+]
+
+_SEVERITY_RE = re.compile(
+    r'\b(?:(?P<Severe>severe|critical|serious)|(?P<Moderate>moderate)|(?P<Mild>mild|minor|better|improving))\b'
+)
+
+_PROGNOSIS_RES = [
+    re.compile(r'(full recovery.*?)(?:\.|$)'),
+    re.compile(r'(expect.*?recovery.*?)(?:\.|$)'),
+    re.compile(r"(don't foresee.*?)(?:\.|$)"),
+    re.compile(r'(no.*?long.term.*?)(?:\.|$)'),
+]
+
+_TREATMENT_RES = [
+    re.compile(r'(physiotherapy.*?)(?:\.|$)'),
+    re.compile(r'(treatment.*?)(?:\.|$)'),
+]
+
+_MED_RE = re.compile(
+    r'[^.,\n]*?\b(?:painkillers|medication|medicine|tablets|prescription|analgesic)[^.,\n]*'
+)
+
+
+_SOAP_TEMPLATE = """\
+{rule}
+CLINICAL SOAP NOTE
+{rule}
+
+📋 SUBJECTIVE
+{sub_rule}
+Chief Complaint: {{chief_complaint}}
+
+History: {{history}}
+
+Review of Systems: {{review_of_systems}}
+
+
+🔬 OBJECTIVE
+{sub_rule}
+Physical Exam: {{physical_examination}}
+
+Vital Signs: {{vital_signs}}
+
+Observations:{{observations}}
+
+
+📊 ASSESSMENT
+{sub_rule}
+Diagnosis: {{diagnosis}}
+Severity: {{severity}}
+Prognosis: {{prognosis}}
+
+
+📝 PLAN
+{sub_rule}
+Treatment: {{treatment_plan}}
+
+Medications:{{medications}}
+
+Follow-up: {{follow_up}}
+
+Patient Education:{{patient_education}}
+
+{rule}""".format(rule="=" * 60, sub_rule="-" * 40)
+
+
+def _span(text: str, match: re.Match, group: int = 0) -> str:
+    """Slice a match's span out of the original-case text."""
+    return text[match.start(group):match.end(group)]
+
+
+def _bullets(items: List[str]) -> str:
+    """Render list items as indented bullet lines, each on its own line."""
+    return ''.join(f"\n  • {item}" for item in items)
+
+
 class SOAPGenerator:
     """
     Generate clinical SOAP notes from medical transcripts.
@@ -50,16 +187,21 @@ class SOAPGenerator:
         Returns:
             Dictionary with all four SOAP sections
         """
-        if not dialogues:
+        if dialogues is None:
             dialogues = self.diarizer.parse_transcript(transcript)
 
         patient_statements = self.diarizer.get_patient_statements(dialogues)
         doctor_statements = self.diarizer.get_doctor_statements(dialogues)
 
-        subjective = self._generate_subjective(patient_statements, transcript)
-        objective = self._generate_objective(doctor_statements, transcript)
-        assessment = self._generate_assessment(transcript, doctor_statements)
-        plan = self._generate_plan(transcript, doctor_statements)
+        # One keyword scan per statement; the extractors only test membership
+        patient_hits = [_keyword_hits(s.lower()) for s in patient_statements]
+        doctor_hits = [_keyword_hits(s.lower()) for s in doctor_statements]
+        transcript_lower = transcript.translate(_ASCII_LOWER)
+
+        subjective = self._generate_subjective(patient_statements, transcript, patient_hits)
+        objective = self._generate_objective(doctor_statements, transcript, doctor_hits, transcript_lower)
+        assessment = self._generate_assessment(transcript, doctor_statements, transcript_lower)
+        plan = self._generate_plan(transcript, doctor_statements, doctor_hits, transcript_lower)
 
         return {
             "subjective": subjective,
@@ -68,64 +210,89 @@ class SOAPGenerator:
             "plan": plan,
         }
 
-    def _generate_subjective(self, patient_statements: List[str], transcript: str) -> Dict:
+    def _generate_subjective(
+        self, patient_statements: List[str], transcript: str, patient_hits: List[frozenset]
+    ) -> Dict:
         """
         Generate Subjective section from patient statements.
 
         Args:
             patient_statements: List of patient dialogue
             transcript: Full transcript
+            patient_hits: Keyword categories per patient statement, index-aligned
 
         Returns:
             Subjective section dictionary
         """
-        chief_complaint = self._extract_chief_complaint(patient_statements)
-        history = self._extract_history(patient_statements)
-        review_of_systems = self._extract_review_of_systems(patient_statements)
+        # Chief complaint, history and review of systems in one walk
+        chief_complaint = None
+        history_parts = []
+        ros_parts = []
+        for index, (statement, hits) in enumerate(zip(patient_statements, patient_hits)):
+            if chief_complaint is None and index < 3 and 'complaint' in hits:
+                chief_complaint = statement
+            if 'history' in hits:
+                history_parts.append(statement)
+            if 'ros' in hits:
+                ros_parts.append(statement)
+
+        if chief_complaint is None:
+            chief_complaint = patient_statements[0] if patient_statements else "Not reported"
 
         return {
             "chief_complaint": chief_complaint,
-            "history_of_present_illness": history,
-            "review_of_systems": review_of_systems,
+            "history_of_present_illness": ' '.join(history_parts) if history_parts else "History not explicitly described",
+            "review_of_systems": ' '.join(ros_parts) if ros_parts else "No additional systems reported",
             "patient_statements": patient_statements,
         }
 
-    def _generate_objective(self, doctor_statements: List[str], transcript: str) -> Dict:
+    def _generate_objective(
+        self,
+        doctor_statements: List[str],
+        transcript: str,
+        doctor_hits: List[frozenset],
+        transcript_lower: str,
+    ) -> Dict:
         """
         Generate Objective section from doctor observations.
 
         Args:
             doctor_statements: List of doctor dialogue
             transcript: Full transcript
+            doctor_hits: Keyword categories per doctor statement, index-aligned
+            transcript_lower: ASCII-lowercased transcript, offset-aligned
 
         Returns:
             Objective section dictionary
         """
-        exam_findings = self._extract_exam_findings(doctor_statements, transcript)
-        vital_signs = self._extract_vital_signs(transcript)
-        observations = self._extract_observations(doctor_statements)
+        exam_findings = self._extract_exam_findings(doctor_statements, transcript, doctor_hits)
+        vital_signs = self._extract_vital_signs(transcript, transcript_lower)
+        observations = [s for s, hits in zip(doctor_statements, doctor_hits) if 'observation' in hits]
 
         return {
             "physical_examination": exam_findings,
             "vital_signs": vital_signs,
-            "observations": observations,
+            "observations": observations if observations else ["No specific observations documented"],
             "doctor_statements": doctor_statements,
         }
 
-    def _generate_assessment(self, transcript: str, doctor_statements: List[str]) -> Dict:
+    def _generate_assessment(
+        self, transcript: str, doctor_statements: List[str], transcript_lower: str
+    ) -> Dict:
         """
         Generate Assessment section.
 
         Args:
             transcript: Full transcript
             doctor_statements: List of doctor dialogue
+            transcript_lower: ASCII-lowercased transcript, offset-aligned
 
         Returns:
             Assessment section dictionary
         """
-        diagnosis = self._extract_diagnosis(transcript)
-        severity = self._extract_severity(transcript)
-        prognosis = self._extract_prognosis(transcript)
+        diagnosis = self._extract_diagnosis(transcript, transcript_lower)
+        severity = self._extract_severity(transcript_lower)
+        prognosis = self._extract_prognosis(transcript, transcript_lower)
 
         return {
             "primary_diagnosis": diagnosis,
@@ -133,198 +300,129 @@ class SOAPGenerator:
             "prognosis": prognosis,
         }
 
-    def _generate_plan(self, transcript: str, doctor_statements: List[str]) -> Dict:
+    def _generate_plan(
+        self,
+        transcript: str,
+        doctor_statements: List[str],
+        doctor_hits: List[frozenset],
+        transcript_lower: str,
+    ) -> Dict:
         """
         Generate Plan section.
 
         Args:
             transcript: Full transcript
             doctor_statements: List of doctor dialogue
+            doctor_hits: Keyword categories per doctor statement, index-aligned
+            transcript_lower: ASCII-lowercased transcript, offset-aligned
 
         Returns:
             Plan section dictionary
         """
-        treatment_plan = self._extract_treatment_plan(transcript, doctor_statements)
-        medications = self._extract_medications(transcript)
-        follow_up = self._extract_follow_up(transcript, doctor_statements)
-        patient_education = self._extract_patient_education(doctor_statements)
+        treatment_plan = self._extract_treatment_plan(transcript, doctor_statements, doctor_hits, transcript_lower)
+        medications = self._extract_medications(transcript, transcript_lower)
+
+        # Follow-up and patient education in one walk
+        follow_up = None
+        education = []
+        for statement, hits in zip(doctor_statements, doctor_hits):
+            if follow_up is None and 'followup' in hits:
+                follow_up = statement
+            if 'education' in hits:
+                education.append(statement)
 
         return {
             "treatment_plan": treatment_plan,
             "medications": medications,
-            "follow_up": follow_up,
-            "patient_education": patient_education,
+            "follow_up": follow_up or "Follow-up as needed if symptoms worsen",
+            "patient_education": education if education else ["General health maintenance advised"],
         }
 
-    def _extract_chief_complaint(self, patient_statements: List[str]) -> str:
-        """Extract chief complaint from first patient statements."""
-        complaint_keywords = ['pain', 'discomfort', 'hurt', 'ache', 'problem', 'issue']
-
-        for statement in patient_statements[:3]:
-            if any(kw in statement.lower() for kw in complaint_keywords):
-                return statement
-
-        return patient_statements[0] if patient_statements else "Not reported"
-
-    def _extract_history(self, patient_statements: List[str]) -> str:
-        """Extract history of present illness."""
-        history_keywords = ['accident', 'happened', 'was', 'went', 'hit', 'started']
-
-        history_parts = []
-        for statement in patient_statements:
-            if any(kw in statement.lower() for kw in history_keywords):
-                history_parts.append(statement)
-
-        return ' '.join(history_parts) if history_parts else "History not explicitly described"
-
-    def _extract_review_of_systems(self, patient_statements: List[str]) -> str:
-        """Extract review of systems from patient statements."""
-        ros_keywords = ['anxiety', 'nervous', 'sleep', 'work', 'daily', 'emotional', 'concentrate']
-
-        ros_parts = []
-        for statement in patient_statements:
-            if any(kw in statement.lower() for kw in ros_keywords):
-                ros_parts.append(statement)
-
-        return ' '.join(ros_parts) if ros_parts else "No additional systems reported"
-
-    def _extract_exam_findings(self, doctor_statements: List[str], transcript: str) -> str:
+    def _extract_exam_findings(
+        self, doctor_statements: List[str], transcript: str, doctor_hits: List[frozenset]
+    ) -> str:
         """Extract physical examination findings."""
-        exam_keywords = ['examination', 'range of movement', 'tenderness', 'looks good', 'condition']
-
-        for statement in doctor_statements:
-            if any(kw in statement.lower() for kw in exam_keywords):
+        for statement, hits in zip(doctor_statements, doctor_hits):
+            if 'exam' in hits:
                 return statement
 
-        exam_pattern = r'\[.*?[Ee]xam.*?\]'
-        match = re.search(exam_pattern, transcript)
+        match = _EXAM_META_RE.search(transcript)
         if match:
             return "Physical examination was conducted. " + (
                 next(
-                    (s for s in doctor_statements if 'look' in s.lower() or 'good' in s.lower()),
+                    (s for s, hits in zip(doctor_statements, doctor_hits) if 'exam_look' in hits),
                     "Findings documented"
                 )
             )
 
         return "Examination findings not documented"
 
-    def _extract_vital_signs(self, transcript: str) -> str:
+    def _extract_vital_signs(self, transcript: str, transcript_lower: str) -> str:
         """Extract vital signs if mentioned."""
-        vital_patterns = ['blood pressure', 'heart rate', 'temperature', 'oxygen']
-
-        for pattern in vital_patterns:
-            if pattern in transcript.lower():
-                match = re.search(rf'{pattern}[:\s]+(.*?)(?:\.|,|$)', transcript, re.IGNORECASE)
-                if match:
-                    return match.group(0)
+        for pattern in _VITAL_RES:
+            match = pattern.search(transcript_lower)
+            if match:
+                return _span(transcript, match)
 
         return "Vital signs not recorded in transcript"
 
-    def _extract_observations(self, doctor_statements: List[str]) -> List[str]:
-        """Extract doctor observations."""
-        observation_keywords = ['normal', 'good', 'full range', 'no sign', 'appears', 'noted']
-
-        observations = []
-        for statement in doctor_statements:
-            if any(kw in statement.lower() for kw in observation_keywords):
-                observations.append(statement)
-
-        return observations if observations else ["No specific observations documented"]
-
-    def _extract_diagnosis(self, transcript: str) -> str:
+    def _extract_diagnosis(self, transcript: str, transcript_lower: str) -> str:
         """Extract primary diagnosis."""
-        patterns = [
-            r'(?:diagnosed with|diagnosis[:\s]+|it was (?:a|an))\s+(.*?)(?:\.|,|$)',
-            r'(whiplash.*?)(?:\.|,|$)',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, transcript, re.IGNORECASE)
+        for pattern in _DIAGNOSIS_RES:
+            match = pattern.search(transcript_lower)
             if match:
-                return match.group(1).strip()
+                return _span(transcript, match, 1).strip()
 
         return "Diagnosis not explicitly stated"
 
-    def _extract_severity(self, transcript: str) -> str:
-        """Extract severity of condition."""
-        if re.search(r'\b(severe|critical|serious)\b', transcript, re.IGNORECASE):
-            return "Severe"
-        elif re.search(r'\b(moderate|moderate)\b', transcript, re.IGNORECASE):
-            return "Moderate"
-        elif re.search(r'\b(mild|minor|better|improving)\b', transcript, re.IGNORECASE):
-            return "Mild"
-        return "Not specified"
-
-    def _extract_prognosis(self, transcript: str) -> str:
+    def _extract_severity(self, transcript_lower: str) -> str:
+        """Extract severity of condition from the lowercased transcript."""
+        # One scan; any severe term wins, otherwise moderate beats mild
+        severity = None
+        for match in _SEVERITY_RE.finditer(transcript_lower):
+            if match.lastgroup == "Severe":
+                return "Severe"
+            if severity is None or match.lastgroup == "Moderate":
+                severity = match.lastgroup
+        return severity or "Not specified"
+
+    def _extract_prognosis(self, transcript: str, transcript_lower: str) -> str:
         """Extract prognosis information."""
-        patterns = [
-            r'(full recovery.*?)(?:\.|$)',
-            r'(expect.*?recovery.*?)(?:\.|$)',
-            r"(don't foresee.*?)(?:\.|$)",
-            r'(no.*?long.term.*?)(?:\.|$)',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, transcript, re.IGNORECASE)
+        for pattern in _PROGNOSIS_RES:
+            match = pattern.search(transcript_lower)
             if match:
-                return match.group(1).strip()
+                return _span(transcript, match, 1).strip()
 
         return "Prognosis not explicitly stated"
 
-    def _extract_treatment_plan(self, transcript: str, doctor_statements: List[str]) -> str:
+    def _extract_treatment_plan(
+        self,
+        transcript: str,
+        doctor_statements: List[str],
+        doctor_hits: List[frozenset],
+        transcript_lower: str,
+    ) -> str:
         """Extract treatment plan."""
-        treatment_keywords = ['treatment', 'therapy', 'physiotherapy', 'medication', 'recommend']
-
-        for statement in doctor_statements:
-            if any(kw in statement.lower() for kw in treatment_keywords):
+        for statement, hits in zip(doctor_statements, doctor_hits):
+            if 'treatment' in hits:
                 return statement
 
-        patterns = [
-            r'(physiotherapy.*?)(?:\.|$)',
-            r'(treatment.*?)(?:\.|$)',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, transcript, re.IGNORECASE)
+        for pattern in _TREATMENT_RES:
+            match = pattern.search(transcript_lower)
             if match:
-                return match.group(1).strip()
+                return _span(transcript, match, 1).strip()
 
         return "Treatment plan not explicitly stated"
 
-    def _extract_medications(self, transcript: str) -> List[str]:
+    def _extract_medications(self, transcript: str, transcript_lower: str) -> List[str]:
         """Extract medications mentioned."""
-        medications = []
-        med_keywords = ['painkillers', 'medication', 'medicine', 'tablets', 'prescription', 'analgesic']
-
-        for keyword in med_keywords:
-            if keyword in transcript.lower():
-                match = re.search(rf'(.*?{keyword}.*?)(?:\.|,|$)', transcript, re.IGNORECASE)
-                if match:
-                    medications.append(match.group(1).strip())
+        # One scan, one clause per mention, duplicates dropped in order
+        medications = list(dict.fromkeys(
+            _span(transcript, m).strip() for m in _MED_RE.finditer(transcript_lower)
+        ))
 
         return medications if medications else ["No specific medications documented"]
 
-    def _extract_follow_up(self, transcript: str, doctor_statements: List[str]) -> str:
-        """Extract follow-up instructions."""
-        followup_keywords = ['follow-up', 'come back', 'return', 'reach out', 'if anything changes']
-
-        for statement in doctor_statements:
-            if any(kw in statement.lower() for kw in followup_keywords):
-                return statement
-
-        return "Follow-up as needed if symptoms worsen"
-
-    def _extract_patient_education(self, doctor_statements: List[str]) -> List[str]:
-        """Extract patient education points."""
-        education_keywords = ['should', 'don\'t', 'if', 'advised', 'important', 'make sure']
-
-        education = []
-        for statement in doctor_statements:
-            if any(kw in statement.lower() for kw in education_keywords):
-                education.append(statement)
-
-        return education if education else ["General health maintenance advised"]
-
     def to_formatted_text(self, soap: Dict) -> str:
         """
         Convert SOAP dictionary to formatted text.
@@ -335,45 +433,24 @@ class SOAPGenerator:
         Returns:
             Formatted SOAP note string
         """
-        lines = []
-        lines.append("=" * 60)
-        lines.append("CLINICAL SOAP NOTE")
-        lines.append("=" * 60)
-
-        lines.append("\n📋 SUBJECTIVE")
-        lines.append("-" * 40)
-        lines.append(f"Chief Complaint: {soap['subjective']['chief_complaint']}")
-        lines.append(f"\nHistory: {soap['subjective']['history_of_present_illness']}")
-        lines.append(f"\nReview of Systems: {soap['subjective']['review_of_systems']}")
-
-        lines.append("\n\n🔬 OBJECTIVE")
-        lines.append("-" * 40)
-        lines.append(f"Physical Exam: {soap['objective']['physical_examination']}")
-        lines.append(f"\nVital Signs: {soap['objective']['vital_signs']}")
-        lines.append("\nObservations:")
-        for obs in soap['objective']['observations']:
-            lines.append(f"  • {obs}")
-
-        lines.append("\n\n📊 ASSESSMENT")
-        lines.append("-" * 40)
-        lines.append(f"Diagnosis: {soap['assessment']['primary_diagnosis']}")
-        lines.append(f"Severity: {soap['assessment']['severity']}")
-        lines.append(f"Prognosis: {soap['assessment']['prognosis']}")
-
-        lines.append("\n\n📝 PLAN")
-        lines.append("-" * 40)
-        lines.append(f"Treatment: {soap['plan']['treatment_plan']}")
-        lines.append("\nMedications:")
-        for med in soap['plan']['medications']:
-            lines.append(f"  • {med}")
-        lines.append(f"\nFollow-up: {soap['plan']['follow_up']}")
-        lines.append("\nPatient Education:")
-        for edu in soap['plan']['patient_education']:
-            lines.append(f"  • {edu}")
-
-        lines.append("\n" + "=" * 60)
-
-        return '\n'.join(lines)
+        subjective, objective = soap['subjective'], soap['objective']
+        assessment, plan = soap['assessment'], soap['plan']
+
+        return _SOAP_TEMPLATE.format_map({
+            'chief_complaint': subjective['chief_complaint'],
+            'history': subjective['history_of_present_illness'],
+            'review_of_systems': subjective['review_of_systems'],
+            'physical_examination': objective['physical_examination'],
+            'vital_signs': objective['vital_signs'],
+            'observations': _bullets(objective['observations']),
+            'diagnosis': assessment['primary_diagnosis'],
+            'severity': assessment['severity'],
+            'prognosis': assessment['prognosis'],
+            'treatment_plan': plan['treatment_plan'],
+            'medications': _bullets(plan['medications']),
+            'follow_up': plan['follow_up'],
+            'patient_education': _bullets(plan['patient_education']),
+        })
 
 
 if __name__ == "__main__":
@@ -383,8 +460,7 @@ if __name__ == "__main__":
 
     generator = SOAPGenerator()
 
-    dialogues = generator.diarizer.parse_transcript(test_transcript)
-    soap = generator.generate(test_transcript, dialogues)
+    soap = generator.generate(test_transcript)
     formatted = generator.to_formatted_text(soap)
 
     print(formatted)
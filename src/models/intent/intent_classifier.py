@@ -9,10 +9,13 @@ Date: February 2026
 """
 
 from transformers import pipeline
-from typing import List, Dict
+from typing import List, Dict, Optional
+import math
 import warnings
+from collections import Counter
 
 from src.config import MODELS, INTENT_CATEGORIES, MODEL_SETTINGS
+from src.utils import quantize_pipeline, run_length_sorted
 
 warnings.filterwarnings('ignore')
 
@@ -51,8 +54,26 @@ class IntentClassifier:
             device=-1
         )
         
+        if MODEL_SETTINGS['intent_int8']:
+            quantize_pipeline(self.model)
+        
         self.intent_labels = INTENT_CATEGORIES
+        self._distribution_template = dict.fromkeys(self.intent_labels, 0)
         self.confidence_threshold = MODEL_SETTINGS['intent_confidence_threshold']
+        self.batch_size = MODEL_SETTINGS['intent_batch_size']
+        
+        # Optional embedding fast path: a small sentence encoder settles
+        # clear-cut statements so only ambiguous ones reach the NLI model
+        self.encoder = None
+        if MODEL_SETTINGS['intent_fast_path']:
+            from sentence_transformers import SentenceTransformer
+            
+            self.encoder = SentenceTransformer(MODELS['intent_encoder'], device='cpu')
+            self.label_embeddings = self.encoder.encode(
+                self.intent_labels, normalize_embeddings=True
+            )
+            self.fast_path_margin = MODEL_SETTINGS['intent_fast_path_margin']
+            self.fast_path_temperature = MODEL_SETTINGS['intent_fast_path_temperature']
     
     def classify_intent(self, text: str) -> Dict:
         """
@@ -73,21 +94,18 @@ class IntentClassifier:
             }
         
         try:
+            if self.encoder is not None:
+                fast = self._fast_path([text])[0]
+                if fast is not None:
+                    return fast
+            
             result = self.model(
-                text[:512],
+                text,
                 candidate_labels=self.intent_labels,
                 multi_label=False
             )
             
-            return {
-                'text': text,
-                'intent': result['labels'][0],
-                'confidence': round(result['scores'][0], 3),
-                'all_scores': {
-                    label: round(score, 3)
-                    for label, score in zip(result['labels'], result['scores'])
-                }
-            }
+            return self._format_result(text, result)
             
         except Exception as e:
             print(f"Error classifying intent: {e}")
@@ -108,17 +126,100 @@ class IntentClassifier:
         Returns:
             List of intent classification results
         """
-        results = []
+        statements = [s for s in statements if len(s.split()) >= 3]
+        if not statements:
+            return []
+        
+        results = [None] * len(statements)
+        if self.encoder is not None:
+            results = self._fast_path(statements)
+        
+        pending = [i for i, result in enumerate(results) if result is None]
+        if not pending:
+            return results
+        
+        def classify(texts):
+            outputs = self.model(
+                texts,
+                candidate_labels=self.intent_labels,
+                multi_label=False,
+                batch_size=self.batch_size
+            )
+            return [outputs] if isinstance(outputs, dict) else outputs
+        
+        try:
+            outputs = run_length_sorted(classify, [statements[i] for i in pending])
+        except Exception as e:
+            print(f"Error classifying intent batch: {e}")
+            outputs = None
+        
+        for n, i in enumerate(pending):
+            if outputs is None:
+                results[i] = self.classify_intent(statements[i])
+            else:
+                results[i] = self._format_result(statements[i], outputs[n])
+        
+        return results
+    
+    def _fast_path(self, texts: List[str]) -> List[Optional[Dict]]:
+        """
+        Classify statements by cosine similarity to the intent labels.
+        
+        Args:
+            texts: Statements to classify
+            
+        Returns:
+            One result per statement with softmax-normalised scores, or None
+            where the top two labels are closer than the configured margin
+            and NLI should decide
+        """
+        embeddings = self.encoder.encode(texts, normalize_embeddings=True)
+        similarities = embeddings @ self.label_embeddings.T
         
-        for statement in statements:
-            if len(statement.split()) < 3:
+        results = []
+        for text, row in zip(texts, similarities):
+            order = row.argsort()[::-1]
+            if row[order[0]] - row[order[1]] < self.fast_path_margin:
+                results.append(None)
                 continue
             
-            intent = self.classify_intent(statement)
-            results.append(intent)
+            # Softmax over the similarities so scores sum to 1 like the
+            # NLI probabilities and share the same confidence threshold
+            top = float(row[order[0]])
+            weights = [
+                math.exp((float(row[i]) - top) / self.fast_path_temperature)
+                for i in order
+            ]
+            total = sum(weights)
+            
+            results.append(self._format_result(text, {
+                'labels': [self.intent_labels[i] for i in order],
+                'scores': [weight / total for weight in weights],
+            }))
         
         return results
     
+    def _format_result(self, text: str, result: Dict) -> Dict:
+        """
+        Convert a zero-shot pipeline result into the classifier output format.
+        
+        Args:
+            text: Original statement text
+            result: Pipeline output with ranked 'labels' and 'scores'
+            
+        Returns:
+            Dictionary with intent, confidence, and all scores
+        """
+        return {
+            'text': text,
+            'intent': result['labels'][0],
+            'confidence': round(result['scores'][0], 3),
+            'all_scores': {
+                label: round(score, 3)
+                for label, score in zip(result['labels'], result['scores'])
+            }
+        }
+    
     def get_intent_distribution(self, results: List[Dict]) -> Dict:
         """
         Calculate intent distribution.
@@ -129,10 +230,7 @@ class IntentClassifier:
         Returns:
             Dictionary with intent counts
         """
-        if not results:
-            return {intent: 0 for intent in self.intent_labels}
-        
-        distribution = {intent: 0 for intent in self.intent_labels}
+        distribution = self._distribution_template.copy()
         
         for result in results:
             intent = result['intent']
@@ -154,8 +252,9 @@ class IntentClassifier:
         if not results:
             return 'unknown'
         
-        distribution = self.get_intent_distribution(results)
-        return max(distribution, key=distribution.get)
+        # Count in one pass; ties go to the earlier label, as before
+        counts = Counter(r['intent'] for r in results)
+        return max(self.intent_labels, key=counts.__getitem__)
 
 
 if __name__ == "__main__":
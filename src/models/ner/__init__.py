@@ -5,7 +5,7 @@ This package provides NER capabilities for extracting medical entities
 from transcripts.
 
 Components:
-    - BaseNER: Abstract base class for NER implementations
+    - BaseNER: Protocol describing the NER interface
     - ScispaCyNER: Medical NER using scispaCy
     - EntityValidator: Validation and cleaning utilities
 """
@@ -1,31 +1,32 @@
 """
 Base NER module defining interface for entity extraction.
 
-This module provides an abstract base class that defines the
+This module provides a structural protocol that defines the
 interface for all NER implementations.
 
 Author: Koushik
 Date: February 2026
 """
 
-from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import Dict, List, Protocol
 
 
-class BaseNER(ABC):
+class BaseNER(Protocol):
     """
-    Abstract base class for Named Entity Recognition.
+    Interface for Named Entity Recognition.
     
-    This class defines the interface that all NER implementations
-    must follow. It ensures consistency across different NER approaches.
+    This protocol defines the methods that all NER implementations
+    must provide. Any class with matching methods satisfies it for
+    type checking; no subclassing or registration is needed.
     
     Example:
-        >>> class MyNER(BaseNER):
+        >>> class MyNER:
         ...     def extract_entities(self, text):
         ...         return {'symptoms': ['pain']}
+        ...     def extract_with_confidence(self, text):
+        ...         return {'symptoms': [{'text': 'pain', 'confidence': 1.0}]}
     """
     
-    @abstractmethod
     def extract_entities(self, text: str) -> Dict[str, List[str]]:
         """
         Extract medical entities from text.
@@ -43,9 +44,8 @@ class BaseNER(ABC):
                 'diagnoses': ['whiplash injury']
             }
         """
-        pass
+        ...
     
-    @abstractmethod
     def extract_with_confidence(self, text: str) -> Dict[str, List[Dict]]:
         """
         Extract entities with confidence scores.
@@ -64,4 +64,4 @@ class BaseNER(ABC):
                 ]
             }
         """
-        pass
\ No newline at end of file
+        ...
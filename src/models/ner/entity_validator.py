@@ -8,9 +8,21 @@ Author: Koushik
 Date: February 2026
 """
 
-from typing import List, Dict, Set
+from typing import List, Dict, Set, FrozenSet
+from functools import lru_cache
 import re
 
+# Entities that are all digits or all punctuation
+_REJECT_RE = re.compile(r'(?:\d+|[^\w\s]+)\Z')
+_WHITESPACE_RE = re.compile(r'\s+')
+_EDGE_PUNCT_RE = re.compile(r'^[^\w\s]+|[^\w\s]+$')
+
+
+@lru_cache(maxsize=4096)
+def _token_set(text: str) -> FrozenSet[str]:
+    """Whitespace token set of a string, cached across similarity calls."""
+    return frozenset(text.split())
+
 
 class EntityValidator:
     """
@@ -45,6 +57,7 @@ class EntityValidator:
             'does', 'did', 'will', 'would', 'could', 'should', 'may',
             'might', 'must', 'can', 'this', 'that', 'these', 'those'
         }
+        self._max_stop_len = max(map(len, self.stop_words))
     
     def validate_entity(self, entity: str) -> bool:
         """
@@ -56,24 +69,20 @@ class EntityValidator:
         Returns:
             True if valid, False otherwise
         """
-        if not entity or not entity.strip():
+        if not entity:
             return False
         
         entity_clean = entity.strip()
+        length = len(entity_clean)
         
-        if len(entity_clean) < self.min_length:
+        if not entity_clean or length < self.min_length or length > self.max_length:
             return False
         
-        if len(entity_clean) > self.max_length:
+        # Only strings short enough to be a stop word need lowercasing
+        if length <= self._max_stop_len and entity_clean.lower() in self.stop_words:
             return False
         
-        if entity_clean.lower() in self.stop_words:
-            return False
-        
-        if re.match(r'^\d+$', entity_clean):
-            return False
-        
-        if re.match(r'^[^\w\s]+$', entity_clean):
+        if _REJECT_RE.match(entity_clean):
             return False
         
         return True
@@ -90,9 +99,9 @@ class EntityValidator:
         """
         entity = entity.strip()
         
-        entity = re.sub(r'\s+', ' ', entity)
+        entity = _WHITESPACE_RE.sub(' ', entity)
         
-        entity = re.sub(r'^[^\w\s]+|[^\w\s]+$', '', entity)
+        entity = _EDGE_PUNCT_RE.sub('', entity)
         
         return entity
     
@@ -106,17 +115,13 @@ class EntityValidator:
         Returns:
             Deduplicated list of entities
         """
-        seen = set()
-        unique = []
+        # First spelling wins; dicts keep insertion order
+        unique = {}
         
         for entity in entities:
-            entity_lower = entity.lower().strip()
-            
-            if entity_lower not in seen:
-                unique.append(entity)
-                seen.add(entity_lower)
+            unique.setdefault(entity.strip().lower(), entity)
         
-        return unique
+        return list(unique.values())
     
     def filter_valid_entities(self, entities: List[str]) -> List[str]:
         """
@@ -128,14 +133,9 @@ class EntityValidator:
         Returns:
             Filtered list of valid entities
         """
-        valid = []
+        clean, validate = self.clean_entity, self.validate_entity
         
-        for entity in entities:
-            cleaned = self.clean_entity(entity)
-            if self.validate_entity(cleaned):
-                valid.append(cleaned)
-        
-        return valid
+        return [cleaned for cleaned in map(clean, entities) if validate(cleaned)]
     
     def remove_substrings(self, entities: List[str]) -> List[str]:
         """
@@ -154,17 +154,26 @@ class EntityValidator:
         
         filtered = []
         
+        # Kept entries strictly longer than the current one, joined with a
+        # separator that cannot occur in entity text; a single C-level `in`
+        # then replaces the loop over kept entities. Same-length entries can
+        # only contain the current one if equal, which never removes it.
+        longer = ''
+        pending = []
+        current_length = None
+        
         for entity in sorted_entities:
-            entity_lower = entity.lower()
+            if len(entity) != current_length:
+                if pending:
+                    longer = '\x00'.join([longer, *pending])
+                    pending = []
+                current_length = len(entity)
             
-            is_substring = False
-            for kept in filtered:
-                if entity_lower in kept.lower() and entity_lower != kept.lower():
-                    is_substring = True
-                    break
+            entity_lower = entity.lower()
             
-            if not is_substring:
+            if not longer or entity_lower not in longer:
                 filtered.append(entity)
+                pending.append(entity_lower)
         
         return filtered
     
@@ -204,6 +213,10 @@ class EntityValidator:
         
         merged = []
         seen = set()
+        kept_tokens = []
+        # token -> indices into kept_tokens; with a non-negative threshold
+        # only kept entries sharing a token can score above it
+        token_index = {} if similarity_threshold >= 0 else None
         
         for entity in entities:
             entity_lower = entity.lower()
@@ -211,15 +224,28 @@ class EntityValidator:
             if entity_lower in seen:
                 continue
             
-            is_similar = False
-            for kept in merged:
-                if self._calculate_similarity(entity_lower, kept.lower()) > similarity_threshold:
-                    is_similar = True
-                    break
+            # Kept entries all differ from entity_lower (checked via `seen`),
+            # so similarity reduces to Jaccard over precomputed token sets
+            tokens = _token_set(entity_lower)
+            if token_index is None:
+                candidates = kept_tokens
+            else:
+                candidates = [
+                    kept_tokens[i]
+                    for i in {i for token in tokens for i in token_index.get(token, ())}
+                ]
+            is_similar = any(
+                self._jaccard(tokens, kept) > similarity_threshold
+                for kept in candidates
+            )
             
             if not is_similar:
                 merged.append(entity)
                 seen.add(entity_lower)
+                if token_index is not None:
+                    for token in tokens:
+                        token_index.setdefault(token, []).append(len(kept_tokens))
+                kept_tokens.append(tokens)
         
         return merged
     
@@ -237,16 +263,26 @@ class EntityValidator:
         if str1 == str2:
             return 1.0
         
-        set1 = set(str1.split())
-        set2 = set(str2.split())
+        return self._jaccard(_token_set(str1), _token_set(str2))
+    
+    @staticmethod
+    def _jaccard(set1: Set[str], set2: Set[str]) -> float:
+        """
+        Jaccard similarity of two token sets.
         
+        Args:
+            set1: First token set
+            set2: Second token set
+            
+        Returns:
+            Similarity score (0-1), 0.0 if either set is empty
+        """
         if not set1 or not set2:
             return 0.0
         
-        intersection = len(set1.intersection(set2))
-        union = len(set1.union(set2))
+        intersection = len(set1 & set2)
         
-        return intersection / union if union > 0 else 0.0
+        return intersection / (len(set1) + len(set2) - intersection)
 
 
 if __name__ == "__main__":
@@ -1,13 +1,97 @@
 """Medical NER using scispaCy models."""
 
-import spacy
 from typing import Dict, List
 import re
+import threading
 import warnings
+from functools import lru_cache
+from heapq import nlargest
 from src.config import MODELS, ENTITY_TYPES, SYMPTOM_KEYWORDS, TREATMENT_KEYWORDS
 
 warnings.filterwarnings('ignore')
 
+# A single-word keyword matches \bkw\b exactly when it is one of the text's
+# \w+ tokens, so those become a set lookup. Multi-word keywords are searched
+# one by one: a shared alternation would miss keywords that overlap or nest
+# inside another match ("back pain" within "lower back pain")
+_WORD_RE = re.compile(r'\w+')
+_RULE_KEYWORDS = set(SYMPTOM_KEYWORDS) | set(TREATMENT_KEYWORDS)
+
+
+def _compile_phrase_keywords(keywords):
+    """Pair each multi-word keyword with its own word-bounded pattern."""
+    return tuple(
+        (kw, re.compile(r'\b%s\b' % re.escape(kw)))
+        for kw in sorted(keywords) if not _WORD_RE.fullmatch(kw)
+    )
+
+
+_PHRASE_KEYWORD_RES = _compile_phrase_keywords(_RULE_KEYWORDS)
+
+# Only doc.ents is used; tok2vec stays since some models' NER listens to it
+_UNUSED_PIPES = ('tagger', 'parser', 'attribute_ruler', 'lemmatizer', 'senter')
+
+_DIAGNOSIS_PATTERNS = [
+    re.compile(r'diagnosed with\s+([^,.]+)', re.IGNORECASE),
+    re.compile(r'diagnosis[:\s]+([^,.]+)', re.IGNORECASE),
+    re.compile(r'it was (?:a|an)\s+([^,.]+?)\s+injury', re.IGNORECASE),
+    re.compile(r'consistent with\s+([^,.]+)', re.IGNORECASE),
+]
+
+_PROGNOSIS_PATTERNS = [
+    re.compile(r'(full recovery.*?)(?:\.|$)', re.IGNORECASE),
+    re.compile(r'(expect.*?recovery.*?)(?:\.|$)', re.IGNORECASE),
+    re.compile(r"(don't foresee.*?)(?:\.|$)", re.IGNORECASE),
+    re.compile(r'(prognosis.*?)(?:\.|$)', re.IGNORECASE),
+]
+
+
+def _first_group(patterns, text: str):
+    """Return the stripped first group of the first pattern that matches."""
+    for pattern in patterns:
+        match = pattern.search(text)
+        if match:
+            return match.group(1).strip()
+
+    return None
+
+
+# Several consumers extract from the same transcript, so cache on the text
+@lru_cache(maxsize=1024)
+def _extract_diagnosis_cached(text: str):
+    return _first_group(_DIAGNOSIS_PATTERNS, text)
+
+
+@lru_cache(maxsize=1024)
+def _extract_prognosis_cached(text: str):
+    return _first_group(_PROGNOSIS_PATTERNS, text)
+
+
+# lru_cache does not stop two threads missing at once, and the pipeline
+# builds ScispaCyNER (directly and via MedicalSummarizer) concurrently
+_SPACY_LOAD_LOCK = threading.Lock()
+
+
+def _load_spacy(model_name: str):
+    """Return the process-wide instance of a spaCy model."""
+    with _SPACY_LOAD_LOCK:
+        return _load_spacy_once(model_name)
+
+
+@lru_cache(maxsize=4)
+def _load_spacy_once(model_name: str):
+    """Load a spaCy model with the unused pipes disabled."""
+    # Imported here so the package (e.g. EntityValidator) loads without spaCy
+    import spacy
+
+    nlp = spacy.load(model_name)
+
+    for name in _UNUSED_PIPES:
+        if name in nlp.pipe_names:
+            nlp.disable_pipe(name)
+
+    return nlp
+
 
 class ScispaCyNER:
     """Medical NER with fallback to general model."""
@@ -19,14 +103,14 @@ class ScispaCyNER:
 
         # Try medical model first (if installed)
         try:
-            self.nlp = spacy.load("en_core_sci_md")
+            self.nlp = _load_spacy("en_core_sci_md")
             print("✅ Loaded en_core_sci_md")
         except Exception:
             print("⚠️ Medical model not available → using en_core_web_sm")
 
         # Always fallback to general model (installed via requirements.txt)
         if self.nlp is None:
-            self.nlp = spacy.load("en_core_web_sm")
+            self.nlp = _load_spacy("en_core_web_sm")
             print("✅ Loaded en_core_web_sm")
 
         self.entity_mapping = ENTITY_TYPES
@@ -45,8 +129,64 @@ class ScispaCyNER:
                 'anatomy': []
             }
 
-        doc = self.nlp(text)
+        return self._process_doc(self.nlp(text), text)
+
+    # ----------------------------------------------------
+
+    def analyze(self, text: str) -> Dict:
+        """
+        Extract entities, diagnosis and prognosis in one call.
+
+        The spaCy pipeline runs once; diagnosis and prognosis come from
+        the cached pattern matchers over the same text.
+        """
+        return {
+            'entities': self.extract_entities(text),
+            'diagnosis': self.extract_diagnosis(text),
+            'prognosis': self.extract_prognosis(text),
+        }
+
+    # ----------------------------------------------------
+
+    def extract_entities_batch(
+        self, texts: List[str], batch_size: int = 64, n_process: int = 1
+    ) -> List[Dict[str, List[str]]]:
+        """Extract medical entities from many texts with nlp.pipe."""
+        results = [
+            {'symptoms': [], 'treatments': [], 'diagnoses': [], 'anatomy': []}
+            for _ in texts
+        ]
+        indices = [i for i, text in enumerate(texts) if text and text.strip()]
+
+        docs = self.nlp.pipe(
+            (texts[i] for i in indices),
+            batch_size=batch_size,
+            n_process=n_process
+        )
+        for i, doc in zip(indices, docs):
+            results[i] = self._process_doc(doc, texts[i])
+
+        return results
+
+    def analyze_batch(
+        self, texts: List[str], batch_size: int = 64, n_process: int = 1
+    ) -> List[Dict]:
+        """Run analyze() over many texts, parsing them with nlp.pipe."""
+        entities = self.extract_entities_batch(texts, batch_size=batch_size, n_process=n_process)
+
+        return [
+            {
+                'entities': text_entities,
+                'diagnosis': self.extract_diagnosis(text),
+                'prognosis': self.extract_prognosis(text),
+            }
+            for text, text_entities in zip(texts, entities)
+        ]
 
+    # ----------------------------------------------------
+
+    def _process_doc(self, doc, text: str) -> Dict[str, List[str]]:
+        """Turn a parsed doc into cleaned entity lists."""
         entities = {
             'symptoms': [],
             'treatments': [],
@@ -112,14 +252,13 @@ class ScispaCyNER:
     def _enhance_with_rules(self, text: str, entities: Dict) -> Dict:
         """Add rule-based keyword extraction."""
         text_lower = text.lower()
+        found = _RULE_KEYWORDS.intersection(_WORD_RE.findall(text_lower))
+        found.update(kw for kw, pattern in _PHRASE_KEYWORD_RES if pattern.search(text_lower))
+        if not found:
+            return entities
 
-        for symptom in SYMPTOM_KEYWORDS:
-            if re.search(rf'\b{symptom}\b', text_lower):
-                entities['symptoms'].append(symptom)
-
-        for treatment in TREATMENT_KEYWORDS:
-            if re.search(rf'\b{treatment}\b', text_lower):
-                entities['treatments'].append(treatment)
+        entities['symptoms'].extend(kw for kw in SYMPTOM_KEYWORDS if kw in found)
+        entities['treatments'].extend(kw for kw in TREATMENT_KEYWORDS if kw in found)
 
         return entities
 
@@ -130,17 +269,15 @@ class ScispaCyNER:
         cleaned = {}
 
         for category, entity_list in entities.items():
-            seen = set()
-            unique = []
+            unique = {}
 
             for entity in entity_list:
-                entity_clean = entity.lower().strip()
-                if entity_clean and len(entity_clean) > 2 and entity_clean not in seen:
-                    unique.append(entity)
-                    seen.add(entity_clean)
+                entity_clean = entity.strip().lower()
+                if len(entity_clean) > 2:
+                    unique.setdefault(entity_clean, entity)
 
-            unique.sort(key=len, reverse=True)
-            cleaned[category] = unique[:20]
+            # Same order as sorted(..., reverse=True)[:20] without a full sort
+            cleaned[category] = nlargest(20, unique.values(), key=len)
 
         return cleaned
 
@@ -148,34 +285,10 @@ class ScispaCyNER:
 
     def extract_diagnosis(self, text: str) -> str:
         """Extract diagnosis phrase."""
-        patterns = [
-            r'diagnosed with\s+([^,.]+)',
-            r'diagnosis[:\s]+([^,.]+)',
-            r'it was (?:a|an)\s+([^,.]+?)\s+injury',
-            r'consistent with\s+([^,.]+)',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
-
-        return None
+        return _extract_diagnosis_cached(text)
 
     # ----------------------------------------------------
 
     def extract_prognosis(self, text: str) -> str:
         """Extract prognosis phrase."""
-        patterns = [
-            r'(full recovery.*?)(?:\.|$)',
-            r'(expect.*?recovery.*?)(?:\.|$)',
-            r"(don't foresee.*?)(?:\.|$)",
-            r'(prognosis.*?)(?:\.|$)',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
-
-        return None
+        return _extract_prognosis_cached(text)
@@ -8,14 +8,22 @@ Author: Koushik
 Date: February 2026
 """
 
+import os
+import threading
+import torch
 from transformers import pipeline
-from typing import List, Dict
+from typing import List, Dict, Tuple
 import warnings
+from collections import OrderedDict, Counter
 
 from src.config import MODELS, SENTIMENT_LABELS, MODEL_SETTINGS
+from src.utils import quantize_pipeline, run_length_sorted
 
 warnings.filterwarnings('ignore')
 
+# Rust tokenizer threads contend with the summary thread pool
+os.environ.setdefault('TOKENIZERS_PARALLELISM', 'false')
+
 
 class SentimentAnalyzer:
     """
@@ -36,6 +44,13 @@ class SentimentAnalyzer:
         'Anxious'
     """
     
+    # Timeline score per medical sentiment
+    _SENTIMENT_SCORES = {
+        'Anxious': -1,
+        'Neutral': 0,
+        'Reassured': 1
+    }
+    
     def __init__(self, model_name: str = None):
         """
         Initialize sentiment analyzer.
@@ -45,14 +60,44 @@ class SentimentAnalyzer:
         """
         model = model_name or MODELS['sentiment']
         
-        self.model = pipeline(
-            "sentiment-analysis",
-            model=model,
-            device=-1
-        )
+        if MODEL_SETTINGS['torch_threads']:
+            torch.set_num_threads(MODEL_SETTINGS['torch_threads'])
+        
+        self.model = None
+        if MODEL_SETTINGS['sentiment_sdpa']:
+            try:
+                self.model = pipeline(
+                    "sentiment-analysis",
+                    model=model,
+                    device=-1,
+                    model_kwargs={'attn_implementation': 'sdpa'}
+                )
+            except (ValueError, TypeError, ImportError):
+                # Architecture (or installed torch) without SDPA support
+                self.model = None
+        
+        if self.model is None:
+            self.model = pipeline(
+                "sentiment-analysis",
+                model=model,
+                device=-1
+            )
+        
+        if MODEL_SETTINGS['sentiment_int8']:
+            quantize_pipeline(self.model)
         
         self.confidence_threshold = MODEL_SETTINGS['sentiment_confidence_threshold']
         self.sentiment_mapping = SENTIMENT_LABELS
+        self.batch_size = MODEL_SETTINGS['sentiment_batch_size']
+        
+        # LRU of stripped text -> (raw label, score); repeated utterances
+        # such as "Okay." skip the forward pass entirely
+        self._cache: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._cache_size = MODEL_SETTINGS['sentiment_cache_size']
+        self._cache_hits = 0
+        self._cache_misses = 0
+        # The pipeline (and so this analyzer) is shared across app sessions
+        self._cache_lock = threading.Lock()
     
     def analyze_sentiment(self, text: str) -> Dict:
         """
@@ -73,19 +118,15 @@ class SentimentAnalyzer:
             }
         
         try:
-            result = self.model(text[:512])[0]
+            cached = self._cache_get(text)
+            if cached is None:
+                with torch.inference_mode():
+                    result = self.model(text, truncation=True)[0]
+                self._cache_put(text, result)
+            else:
+                result = {'label': cached[0], 'score': cached[1]}
             
-            sentiment = self._map_to_medical_context(
-                result['label'],
-                result['score']
-            )
-            
-            return {
-                'text': text,
-                'sentiment': sentiment,
-                'confidence': round(result['score'], 3),
-                'raw_label': result['label']
-            }
+            return self._format_result(text, result)
             
         except Exception as e:
             print(f"Error analyzing sentiment: {e}")
@@ -106,16 +147,124 @@ class SentimentAnalyzer:
         Returns:
             List of sentiment analysis results
         """
-        results = []
+        statements = [s for s in statements if len(s.split()) >= 3]
+        if not statements:
+            return []
+        
+        cached = [self._cache_get(statement) for statement in statements]
+        # Each distinct uncached text is forwarded once
+        pending = list(dict.fromkeys(
+            statement.strip() for statement, hit in zip(statements, cached) if hit is None
+        ))
         
-        for statement in statements:
-            if len(statement.split()) < 3:
-                continue
+        fresh = {}
+        if pending:
+            try:
+                with torch.inference_mode():
+                    outputs = run_length_sorted(
+                        lambda texts: self.model(
+                            texts,
+                            batch_size=self.batch_size,
+                            truncation=True
+                        ),
+                        pending
+                    )
+            except Exception as e:
+                print(f"Error analyzing sentiment batch: {e}")
+                return [self.analyze_sentiment(statement) for statement in statements]
             
-            analysis = self.analyze_sentiment(statement)
-            results.append(analysis)
+            for text, output in zip(pending, outputs):
+                self._cache_put(text, output)
+                fresh[text] = output
         
-        return results
+        return [
+            self._format_result(
+                statement,
+                fresh[statement.strip()] if hit is None else {'label': hit[0], 'score': hit[1]}
+            )
+            for statement, hit in zip(statements, cached)
+        ]
+    
+    def _cache_get(self, text: str):
+        """
+        Look up a cached (label, score) pair and mark it recently used.
+        
+        Args:
+            text: Statement text
+            
+        Returns:
+            Cached (label, score) tuple, or None on a miss
+        """
+        key = text.strip()
+        with self._cache_lock:
+            hit = self._cache.get(key)
+            
+            if hit is None:
+                self._cache_misses += 1
+            else:
+                self._cache_hits += 1
+                self._cache.move_to_end(key)
+        
+        return hit
+    
+    def _cache_put(self, text: str, result: Dict):
+        """
+        Store a pipeline result, evicting the least recently used entry.
+        
+        Args:
+            text: Statement text
+            result: Pipeline output with 'label' and 'score'
+        """
+        if self._cache_size <= 0:
+            return
+        
+        key = text.strip()
+        with self._cache_lock:
+            self._cache[key] = (result['label'], result['score'])
+            self._cache.move_to_end(key)
+            
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+    
+    def cache_clear(self):
+        """Drop all memoized sentiment results and reset the counters."""
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_hits = 0
+            self._cache_misses = 0
+    
+    def cache_stats(self) -> Dict:
+        """
+        Report memoization effectiveness.
+        
+        Returns:
+            Dictionary with hits, misses, current size and max size
+        """
+        with self._cache_lock:
+            return {
+                'hits': self._cache_hits,
+                'misses': self._cache_misses,
+                'size': len(self._cache),
+                'max_size': self._cache_size
+            }
+    
+    def _format_result(self, text: str, result: Dict) -> Dict:
+        """
+        Convert a sentiment pipeline result into the analyzer output format.
+        
+        Args:
+            text: Original statement text
+            result: Pipeline output with 'label' and 'score'
+            
+        Returns:
+            Dictionary with sentiment, confidence, and raw label
+        """
+        return {
+            'text': text,
+            'sentiment': self._map_to_medical_context(result['label'], result['score']),
+            'confidence': round(result['score'], 3),
+            'raw_label': result['label']
+        }
     
     def _map_to_medical_context(self, label: str, confidence: float) -> str:
         """
@@ -151,13 +300,17 @@ class SentimentAnalyzer:
                 'avg_confidence': 0.0
             }
         
-        sentiments = [r['sentiment'] for r in results]
-        confidences = [r['confidence'] for r in results]
+        counts = Counter()
+        confidence_sum = 0.0
+        
+        for r in results:
+            counts[r['sentiment']] += 1
+            confidence_sum += r['confidence']
         
         distribution = {
-            'Anxious': sentiments.count('Anxious'),
-            'Neutral': sentiments.count('Neutral'),
-            'Reassured': sentiments.count('Reassured')
+            'Anxious': counts['Anxious'],
+            'Neutral': counts['Neutral'],
+            'Reassured': counts['Reassured']
         }
         
         dominant = max(distribution, key=distribution.get)
@@ -165,8 +318,8 @@ class SentimentAnalyzer:
         return {
             'distribution': distribution,
             'dominant_sentiment': dominant,
-            'total_statements': len(sentiments),
-            'avg_confidence': round(sum(confidences) / len(confidences), 3) if confidences else 0.0
+            'total_statements': len(results),
+            'avg_confidence': round(confidence_sum / len(results), 3)
         }
     
     def get_sentiment_timeline(self, results: List[Dict]) -> List[Dict]:
@@ -179,23 +332,17 @@ class SentimentAnalyzer:
         Returns:
             List of sentiment points for timeline
         """
-        timeline = []
-        
-        sentiment_scores = {
-            'Anxious': -1,
-            'Neutral': 0,
-            'Reassured': 1
-        }
+        scores = self._SENTIMENT_SCORES
         
-        for i, result in enumerate(results):
-            timeline.append({
-                'position': i + 1,
+        return [
+            {
+                'position': i,
                 'sentiment': result['sentiment'],
-                'score': sentiment_scores.get(result['sentiment'], 0),
+                'score': scores.get(result['sentiment'], 0),
                 'confidence': result['confidence']
-            })
-        
-        return timeline
+            }
+            for i, result in enumerate(results, 1)
+        ]
 
 
 if __name__ == "__main__":
@@ -9,7 +9,9 @@ Date: February 2026
 """
 
 from keybert import KeyBERT
-from typing import List, Tuple, Set
+from typing import List, Tuple, Set, Optional
+import re
+import threading
 import warnings
 
 from src.config import PROCESSING_CONFIG
@@ -17,6 +19,29 @@ from src.config import PROCESSING_CONFIG
 warnings.filterwarnings('ignore')
 
 
+def _substring_re(terms: List[str]) -> 're.Pattern':
+    """Compile terms into one alternation matching any of them as a substring."""
+    return re.compile('|'.join(map(re.escape, sorted(terms, key=len, reverse=True))))
+
+
+_MEDICAL_INDICATOR_RE = _substring_re([
+    'injury', 'pain', 'therapy', 'treatment', 'accident',
+    'exam', 'diagnosis', 'recovery', 'symptom', 'medical',
+    'physiotherapy', 'medication', 'sessions', 'whiplash',
+    'examination', 'prognosis', 'stiffness', 'discomfort'
+])
+
+_SYMPTOM_TERM_RE = _substring_re(['pain', 'ache', 'discomfort', 'stiffness', 'tenderness'])
+_TREATMENT_TERM_RE = _substring_re(['therapy', 'treatment', 'medication', 'sessions', 'physiotherapy'])
+_CONDITION_TERM_RE = _substring_re(['injury', 'accident', 'diagnosis', 'whiplash', 'strain'])
+
+_CATEGORY_TERM_RES = (
+    ('symptoms', _SYMPTOM_TERM_RE),
+    ('treatments', _TREATMENT_TERM_RE),
+    ('conditions', _CONDITION_TERM_RE),
+)
+
+
 class MedicalKeywordExtractor:
     """
     Extract medical keywords and phrases from text.
@@ -28,6 +53,11 @@ class MedicalKeywordExtractor:
         kw_model: KeyBERT model instance
         max_keywords: Maximum number of keywords to extract
         
+    A preloaded SentenceTransformer can be injected so several
+    extractors (or other components) share one copy of the weights:
+        >>> encoder = SentenceTransformer('all-MiniLM-L6-v2', device='cuda')
+        >>> extractor = MedicalKeywordExtractor(shared_encoder=encoder)
+        
     Example:
         >>> extractor = MedicalKeywordExtractor()
         >>> text = "Patient has neck pain and received physiotherapy"
@@ -36,19 +66,33 @@ class MedicalKeywordExtractor:
         [('neck pain', 0.65), ('physiotherapy', 0.58)]
     """
     
-    def __init__(self):
-        """Initialize keyword extractor."""
-        self.kw_model = KeyBERT()
+    def __init__(self, shared_encoder: Optional['SentenceTransformer'] = None):
+        """
+        Initialize keyword extractor.
+        
+        Args:
+            shared_encoder: Preloaded SentenceTransformer to embed with
+                (default: KeyBERT loads its own)
+        """
+        self.kw_model = KeyBERT(model=shared_encoder) if shared_encoder is not None else KeyBERT()
         
         self.max_keywords = PROCESSING_CONFIG['max_keywords']
         self.ngram_range = PROCESSING_CONFIG['keyword_ngram_range']
         
+        # Candidate n-gram -> embedding; recurring domain phrases
+        # ("neck pain", "physiotherapy") are only encoded once
+        self._embedding_cache = {}
+        # The pipeline (and so this extractor) is shared across app sessions
+        self._embedding_cache_lock = threading.Lock()
+        self._embedding_cache_size = PROCESSING_CONFIG['keyword_embedding_cache_size']
+        
         self.medical_stopwords = {
             'patient', 'doctor', 'physician', 'said', 'told',
             'asked', 'feel', 'feeling', 'yes', 'no', 'okay',
             'hello', 'hi', 'good', 'morning', 'afternoon',
             'thank', 'thanks', 'welcome', 'bye', 'goodbye'
         }
+        self._stopword_re = _substring_re(list(self.medical_stopwords))
     
     def extract_keywords(
         self,
@@ -67,31 +111,126 @@ class MedicalKeywordExtractor:
         Returns:
             List of (keyword, score) tuples
         """
-        if not text or not text.strip():
-            return []
+        return self.extract_keywords_batch([text], top_n=top_n, diversity=diversity)[0]
+    
+    def extract_keywords_batch(
+        self,
+        texts: List[str],
+        top_n: int = None,
+        diversity: float = 0.7
+    ) -> List[List[Tuple[str, float]]]:
+        """
+        Extract top keywords from several texts in one KeyBERT call.
+        
+        Documents and candidates are embedded together, so the sentence
+        encoder runs batched forwards instead of one per text.
+        
+        Args:
+            texts: Input medical texts
+            top_n: Number of keywords per text (default from config)
+            diversity: Diversity of results (0-1, higher = more diverse)
+            
+        Returns:
+            One list of (keyword, score) tuples per input text
+        """
+        results = [[] for _ in texts]
+        indices = [i for i, text in enumerate(texts) if text and text.strip()]
+        if not indices:
+            return results
         
         top_n = top_n or self.max_keywords
+        docs = [texts[i] for i in indices]
         
         try:
-            keywords = self.kw_model.extract_keywords(
-                text,
+            options = dict(
                 keyphrase_ngram_range=self.ngram_range,
                 stop_words='english',
                 top_n=top_n * 2,
                 use_mmr=True,
                 diversity=diversity
             )
+            try:
+                word_embeddings = self._candidate_embeddings(docs)
+            except Exception as e:
+                # The cache is only an optimisation; let KeyBERT embed
+                # the candidates itself rather than losing the keywords
+                print(f"Error reusing candidate embeddings: {e}")
+                word_embeddings = None
             
+            try:
+                if word_embeddings is None:
+                    keywords = self.kw_model.extract_keywords(docs, **options)
+                else:
+                    keywords = self.kw_model.extract_keywords(
+                        docs, word_embeddings=word_embeddings, **options
+                    )
+            except TypeError:
+                # KeyBERT < 0.8 has no word_embeddings argument
+                self._embedding_cache_size = 0
+                keywords = self.kw_model.extract_keywords(docs, **options)
+        except Exception as e:
+            print(f"Error extracting keywords: {e}")
+            return results
+        
+        # KeyBERT returns a flat list for a single document
+        if len(docs) == 1:
+            keywords = [keywords]
+        
+        for i, doc_keywords in zip(indices, keywords):
             filtered = [
-                (kw, score) for kw, score in keywords
-                if not any(stop in kw.lower() for stop in self.medical_stopwords)
+                (kw, score) for kw, score in doc_keywords
+                if not self._stopword_re.search(kw.lower())
             ]
+            results[i] = filtered[:top_n]
+        
+        return results
+    
+    def _candidate_embeddings(self, docs: List[str]):
+        """
+        Embed KeyBERT's candidate n-grams for docs, reusing cached vectors.
+        
+        The vectorizer mirrors the one KeyBERT builds internally, so the
+        rows line up with its candidate order.
+        
+        Args:
+            docs: Non-empty documents about to be passed to KeyBERT
             
-            return filtered[:top_n]
-            
-        except Exception as e:
-            print(f"Error extracting keywords: {e}")
-            return []
+        Returns:
+            Candidate embedding matrix, or None when caching is disabled
+            or the documents yield no candidates
+        """
+        if self._embedding_cache_size <= 0:
+            return None
+        
+        import numpy as np
+        from sklearn.feature_extraction.text import CountVectorizer
+        
+        try:
+            words = CountVectorizer(
+                ngram_range=self.ngram_range,
+                stop_words='english'
+            ).fit(docs).get_feature_names_out()
+        except ValueError:
+            return None
+        
+        # Snapshot the cached vectors under the lock, embed the rest
+        # outside it, then publish them under the lock again
+        with self._embedding_cache_lock:
+            known = {word: self._embedding_cache.get(word) for word in words}
+        
+        missing = [word for word, vector in known.items() if vector is None]
+        if missing:
+            known.update(zip(missing, self.kw_model.model.embed(missing)))
+        
+        embeddings = np.vstack([known[word] for word in words])
+        
+        with self._embedding_cache_lock:
+            cache = self._embedding_cache
+            if len(cache) + len(missing) > self._embedding_cache_size:
+                cache.clear()
+            cache.update((word, known[word]) for word in missing)
+        
+        return embeddings
     
     def extract_medical_phrases(
         self,
@@ -108,21 +247,42 @@ class MedicalKeywordExtractor:
         Returns:
             List of medical phrase strings
         """
-        keywords = self.extract_keywords(text, top_n=top_n or 15)
+        return self.extract_medical_phrases_batch([text], top_n=top_n)[0]
+    
+    def extract_medical_phrases_batch(
+        self,
+        texts: List[str],
+        top_n: int = None
+    ) -> List[List[str]]:
+        """
+        Extract medical-specific phrases from several texts at once.
         
-        medical_phrases = []
-        medical_indicators = [
-            'injury', 'pain', 'therapy', 'treatment', 'accident',
-            'exam', 'diagnosis', 'recovery', 'symptom', 'medical',
-            'physiotherapy', 'medication', 'sessions', 'whiplash',
-            'examination', 'prognosis', 'stiffness', 'discomfort'
+        Args:
+            texts: Input medical texts
+            top_n: Number of phrases to extract per text
+            
+        Returns:
+            One list of medical phrase strings per input text
+        """
+        return [
+            self.select_medical_phrases(keywords)
+            for keywords in self.extract_keywords_batch(texts, top_n=top_n or 15)
         ]
+    
+    def select_medical_phrases(self, keywords: List[Tuple[str, float]]) -> List[str]:
+        """
+        Keep the keywords that mention a medical indicator term.
         
-        for phrase, score in keywords:
-            if any(indicator in phrase.lower() for indicator in medical_indicators):
-                medical_phrases.append(phrase)
-        
-        return medical_phrases
+        Args:
+            keywords: (keyword, score) tuples from extract_keywords
+            
+        Returns:
+            List of medical phrase strings
+        """
+        return [
+            phrase for phrase, score in keywords
+            if _MEDICAL_INDICATOR_RE.search(phrase.lower())
+        ]
     
     def extract_by_category(self, text: str) -> dict:
         """
@@ -143,29 +303,15 @@ class MedicalKeywordExtractor:
             'general': []
         }
         
-        symptom_terms = ['pain', 'ache', 'discomfort', 'stiffness', 'tenderness']
-        treatment_terms = ['therapy', 'treatment', 'medication', 'sessions', 'physiotherapy']
-        condition_terms = ['injury', 'accident', 'diagnosis', 'whiplash', 'strain']
-        
-        for keyword, score in all_keywords:
-            kw_lower = keyword.lower()
-            
-            categorized = False
-            
-            if any(term in kw_lower for term in symptom_terms):
-                categories['symptoms'].append((keyword, score))
-                categorized = True
-            
-            if any(term in kw_lower for term in treatment_terms):
-                categories['treatments'].append((keyword, score))
-                categorized = True
+        for item in all_keywords:
+            kw_lower = item[0].lower()
             
-            if any(term in kw_lower for term in condition_terms):
-                categories['conditions'].append((keyword, score))
-                categorized = True
+            # A keyword can fall in several categories; 'general' only
+            # collects the ones no category matched
+            tags = [name for name, pattern in _CATEGORY_TERM_RES if pattern.search(kw_lower)]
             
-            if not categorized:
-                categories['general'].append((keyword, score))
+            for name in tags or ('general',):
+                categories[name].append(item)
         
         return categories
     
@@ -8,13 +8,30 @@ Author: Koushik
 Date: February 2026
 """
 
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 import re
 
+from src.config import PROCESSING_CONFIG
 from src.models.ner import ScispaCyNER
 from src.preprocessing import TemporalExtractor
 from .keyword_extractor import MedicalKeywordExtractor
 
+_NAME_PATTERNS = [
+    re.compile(r'Ms\.\s+([A-Z][a-z]+)'),
+    re.compile(r'Mr\.\s+([A-Z][a-z]+)'),
+    re.compile(r'Mrs\.\s+([A-Z][a-z]+)'),
+    re.compile(r'Patient\s+([A-Z][a-z]+\s+[A-Z][a-z]+)'),
+]
+
+_STATUS_PATTERNS = [
+    re.compile(r'(currently.*?)(?:\.|$)', re.IGNORECASE),
+    re.compile(r'(now.*?pain.*?)(?:\.|$)', re.IGNORECASE),
+    re.compile(r'(occasional.*?)(?:\.|$)', re.IGNORECASE),
+]
+
+_DURATION_RE = re.compile(r'(\d+\s*(?:session|week|month)s?)', re.IGNORECASE)
+
 
 class MedicalSummarizer:
     """
@@ -35,16 +52,25 @@ class MedicalSummarizer:
         'whiplash injury'
     """
     
-    def __init__(self):
-        """Initialize medical summarizer with all components."""
+    def __init__(self, shared_encoder: Optional['SentenceTransformer'] = None):
+        """
+        Initialize medical summarizer with all components.
+        
+        Args:
+            shared_encoder: Preloaded SentenceTransformer passed on to the
+                keyword extractor (optional)
+        """
         self.ner = ScispaCyNER()
         self.temporal_extractor = TemporalExtractor()
-        self.keyword_extractor = MedicalKeywordExtractor()
+        self.keyword_extractor = MedicalKeywordExtractor(shared_encoder=shared_encoder)
     
     def generate_summary(
         self,
         transcript: str,
-        dialogues: List[Dict] = None
+        dialogues: List[Dict] = None,
+        keywords: List[str] = None,
+        ner_result: Dict = None,
+        temporal: Dict = None
     ) -> Dict:
         """
         Generate complete structured summary.
@@ -52,22 +78,46 @@ class MedicalSummarizer:
         Args:
             transcript: Full transcript text
             dialogues: Parsed dialogue list (optional)
+            keywords: Precomputed medical phrases (optional)
+            ner_result: Precomputed ScispaCyNER.analyze() output (optional)
+            temporal: Precomputed TemporalExtractor.extract_all_temporal()
+                output (optional)
             
         Returns:
             Dictionary with complete medical summary
         """
-        entities = self.ner.extract_entities(transcript)
-        
-        diagnosis = self.ner.extract_diagnosis(transcript)
-        prognosis = self.ner.extract_prognosis(transcript)
+        # Only the parts the caller did not precompute are extracted
+        jobs = {}
+        if ner_result is None:
+            jobs['ner'] = lambda: self.ner.analyze(transcript)
+        if temporal is None:
+            jobs['temporal'] = lambda: self.temporal_extractor.extract_all_temporal(transcript)
+        if keywords is None:
+            jobs['keywords'] = lambda: self.keyword_extractor.extract_medical_phrases(transcript)
         
-        keywords = self.keyword_extractor.extract_medical_phrases(transcript)
+        if PROCESSING_CONFIG['parallel_summary'] and len(jobs) > 1:
+            # spaCy and torch release the GIL in native code, so the
+            # independent extractors overlap on a thread pool while the
+            # regex extractors run here
+            with ThreadPoolExecutor(max_workers=PROCESSING_CONFIG['summary_workers']) as pool:
+                futures = {name: pool.submit(fn) for name, fn in jobs.items()}
+                patient_name, current_status, treatment_duration = self._extract_regex_fields(
+                    transcript, dialogues
+                )
+                done = {name: future.result() for name, future in futures.items()}
+        else:
+            done = {name: fn() for name, fn in jobs.items()}
+            patient_name, current_status, treatment_duration = self._extract_regex_fields(
+                transcript, dialogues
+            )
         
-        temporal = self.temporal_extractor.extract_all_temporal(transcript)
+        ner_result = done.get('ner', ner_result)
+        temporal = done.get('temporal', temporal)
+        keywords = done.get('keywords', keywords)
         
-        patient_name = self._extract_patient_name(transcript)
-        
-        current_status = self._extract_current_status(transcript, dialogues)
+        entities = ner_result['entities']
+        diagnosis = ner_result['diagnosis']
+        prognosis = ner_result['prognosis']
         
         summary = {
             'patient_name': patient_name,
@@ -78,14 +128,14 @@ class MedicalSummarizer:
             'prognosis': prognosis,
             'temporal_info': {
                 'incident_date': self._extract_incident_date(temporal),
-                'treatment_duration': self._extract_treatment_duration(transcript),
+                'treatment_duration': treatment_duration,
                 'dates': [d['text'] for d in temporal.get('dates', [])],
                 'durations': [d['text'] for d in temporal.get('durations', [])],
             },
             'medical_keywords': keywords,
             'anatomy_mentioned': entities.get('anatomy', []),
             'metadata': {
-                'total_entities': sum(len(v) for v in entities.values()),
+                'total_entities': sum(map(len, entities.values())),
                 'has_diagnosis': diagnosis is not None,
                 'has_prognosis': prognosis is not None,
             }
@@ -93,6 +143,55 @@ class MedicalSummarizer:
         
         return summary
     
+    def generate_summary_batch(
+        self,
+        transcripts: List[str],
+        dialogues_list: List[List[Dict]] = None,
+        n_process: int = 1
+    ) -> List[Dict]:
+        """
+        Generate summaries for several transcripts.
+        
+        NER runs through spaCy's nlp.pipe and keyword extraction through
+        one batched KeyBERT call; the remaining regex extractors run per
+        transcript. Models are shared, so do not call this concurrently
+        from several threads on one summarizer.
+        
+        Args:
+            transcripts: Full transcript texts
+            dialogues_list: Parsed dialogues per transcript (optional)
+            n_process: Worker processes for spaCy parsing
+            
+        Returns:
+            One summary dictionary per transcript
+        """
+        dialogues_list = dialogues_list or [None] * len(transcripts)
+        ner_results = self.ner.analyze_batch(transcripts, n_process=n_process)
+        keywords_list = self.keyword_extractor.extract_medical_phrases_batch(transcripts)
+        
+        return [
+            self.generate_summary(transcript, dialogues, keywords=keywords, ner_result=ner_result)
+            for transcript, dialogues, keywords, ner_result
+            in zip(transcripts, dialogues_list, keywords_list, ner_results)
+        ]
+    
+    def _extract_regex_fields(self, transcript: str, dialogues: List[Dict] = None) -> Tuple:
+        """
+        Run the cheap regex-based extractors.
+        
+        Args:
+            transcript: Full transcript text
+            dialogues: Parsed dialogue list (optional)
+            
+        Returns:
+            Tuple of (patient_name, current_status, treatment_duration)
+        """
+        return (
+            self._extract_patient_name(transcript),
+            self._extract_current_status(transcript, dialogues),
+            self._extract_treatment_duration(transcript),
+        )
+    
     def _extract_patient_name(self, text: str) -> str:
         """
         Extract patient name from text.
@@ -103,15 +202,8 @@ class MedicalSummarizer:
         Returns:
             Patient name or default
         """
-        patterns = [
-            r'Ms\.\s+([A-Z][a-z]+)',
-            r'Mr\.\s+([A-Z][a-z]+)',
-            r'Mrs\.\s+([A-Z][a-z]+)',
-            r'Patient\s+([A-Z][a-z]+\s+[A-Z][a-z]+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text)
+        for pattern in _NAME_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(0)
         
@@ -133,25 +225,18 @@ class MedicalSummarizer:
             Current status description
         """
         if dialogues:
-            patient_statements = [
-                d['text'] for d in dialogues
-                if d['speaker'] == 'patient'
-            ]
-            
-            status_keywords = ['better', 'improving', 'occasional', 'still', 'now']
+            status_keywords = ('better', 'improving', 'occasional', 'still', 'now')
             
-            for statement in reversed(patient_statements):
-                if any(kw in statement.lower() for kw in status_keywords):
-                    return statement
-        
-        status_patterns = [
-            r'(currently.*?)(?:\.|$)',
-            r'(now.*?pain.*?)(?:\.|$)',
-            r'(occasional.*?)(?:\.|$)',
-        ]
+            for d in reversed(dialogues):
+                if d['speaker'] != 'patient':
+                    continue
+                
+                statement_lower = d['text'].lower()
+                if any(kw in statement_lower for kw in status_keywords):
+                    return d['text']
         
-        for pattern in status_patterns:
-            match = re.search(pattern, transcript, re.IGNORECASE)
+        for pattern in _STATUS_PATTERNS:
+            match = pattern.search(transcript)
             if match:
                 return match.group(1).strip()
         
@@ -182,8 +267,7 @@ class MedicalSummarizer:
         Returns:
             Treatment duration or None
         """
-        duration_pattern = r'(\d+\s*(?:session|week|month)s?)'
-        match = re.search(duration_pattern, text, re.IGNORECASE)
+        match = _DURATION_RE.search(text)
         
         if match:
             return match.group(0)
@@ -8,9 +8,9 @@ Author: Koushik
 Date: February 2026
 """
 
-import json
 import warnings
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
 from datetime import datetime
 
 from src.preprocessing import TextCleaner, SpeakerDiarizer, TemporalExtractor
@@ -18,7 +18,8 @@ from src.models.ner import ScispaCyNER, EntityValidator
 from src.models.sentiment import SentimentAnalyzer
 from src.models.intent import IntentClassifier
 from src.models.summarization import MedicalKeywordExtractor, MedicalSummarizer
-from src.config import OUTPUT_CONFIG, DATA_OUTPUT
+from src.config import MODELS, OUTPUT_CONFIG, DATA_OUTPUT, PROCESSING_CONFIG
+from src.utils import dumps_json
 
 warnings.filterwarnings('ignore')
 
@@ -32,31 +33,104 @@ class MedicalNLPPipeline:
     summary, and keywords.
 
     Example:
-        >>> pipeline = MedicalNLPPipeline()
-        >>> result = pipeline.process(open("transcript.txt").read())
+        >>> with MedicalNLPPipeline() as pipeline:
+        ...     result = pipeline.process(open("transcript.txt").read())
         >>> print(result['summary']['diagnosis'])
     """
 
-    def __init__(self):
-        """Initialize all NLP components."""
-        print("Loading pipeline components...")
+    def __init__(self, verbose: bool = True):
+        """
+        Initialize all NLP components.
+
+        Args:
+            verbose: Print progress messages while loading and processing;
+                turn off for bulk runs over many transcripts
+        """
+        self.verbose = verbose
+        self._log("Loading pipeline components...")
         self.text_cleaner = TextCleaner()
         self.diarizer = SpeakerDiarizer()
         self.temporal_extractor = TemporalExtractor()
-        self.ner = ScispaCyNER()
         self.entity_validator = EntityValidator()
-        self.sentiment_analyzer = SentimentAnalyzer()
-        self.intent_classifier = IntentClassifier()
-        self.keyword_extractor = MedicalKeywordExtractor()
-        self.summarizer = MedicalSummarizer()
-        print("✅ All components loaded!")
 
-    def process(self, raw_text: str) -> Dict:
+        # Stages after diarization only depend on the cleaned text and the
+        # patient statements, so they can overlap; spaCy and torch release
+        # the GIL in native code
+        self._executor = None
+        if PROCESSING_CONFIG['parallel_pipeline']:
+            self._executor = ThreadPoolExecutor(max_workers=PROCESSING_CONFIG['pipeline_workers'])
+
+        # Model loading is mostly disk reads and deserialization, so the
+        # heavy components are loaded side by side on the same executor
+        loaders = {
+            'ner': ScispaCyNER,
+            'sentiment_analyzer': SentimentAnalyzer,
+            'intent_classifier': IntentClassifier,
+            '_summarization': self._load_summarization,
+        }
+        if self._executor is not None:
+            futures = {name: self._executor.submit(fn) for name, fn in loaders.items()}
+            loaded = {name: future.result() for name, future in futures.items()}
+        else:
+            loaded = {name: fn() for name, fn in loaders.items()}
+
+        self.ner = loaded['ner']
+        self.sentiment_analyzer = loaded['sentiment_analyzer']
+        self.intent_classifier = loaded['intent_classifier']
+        self.keyword_extractor, self.summarizer = loaded['_summarization']
+        self._log("✅ All components loaded!")
+
+    def _log(self, message: str):
+        """Print a progress message when verbose."""
+        if self.verbose:
+            print(message)
+
+    def close(self):
+        """Shut down the stage executor; the pipeline runs sequentially afterwards."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @staticmethod
+    def _load_summarization():
+        """Load the keyword extractor and summarizer around one encoder."""
+        # One sentence encoder serves both KeyBERT instances
+        from sentence_transformers import SentenceTransformer
+        encoder = SentenceTransformer(MODELS['keyword_encoder'], device='cpu')
+        return (
+            MedicalKeywordExtractor(shared_encoder=encoder),
+            MedicalSummarizer(shared_encoder=encoder),
+        )
+
+    def process(
+        self,
+        raw_text: str,
+        on_stage: Optional[Callable[[str], None]] = None,
+        *,
+        ner: bool = True,
+        sentiment: bool = True,
+        intent: bool = True,
+    ) -> Dict:
         """
         Run full pipeline on raw transcript.
 
         Args:
             raw_text: Raw medical transcript text
+            on_stage: Optional callback invoked with the stage name
+                ("cleaning", "diarization", "ner", "temporal", "sentiment",
+                "intent", "summary") as each stage starts
+            ner: Run entity, diagnosis and prognosis extraction
+            sentiment: Run sentiment analysis on patient statements
+            intent: Run intent classification on patient statements
+
+        Disabled stages are skipped entirely and leave empty results
+        of the usual shape in the output.
 
         Returns:
             Complete structured output dictionary
@@ -64,39 +138,197 @@ class MedicalNLPPipeline:
         if not raw_text or not raw_text.strip():
             return {"error": "Empty input text"}
 
-        print("\n🔄 Processing transcript...")
+        def stage(name: str):
+            if on_stage is not None:
+                on_stage(name)
+
+        self._log("\n🔄 Processing transcript...")
 
-        print("   [1/7] Cleaning text...")
+        stage("cleaning")
+        self._log("   [1/7] Cleaning text...")
         cleaned_text = self.text_cleaner.clean(raw_text)
 
-        print("   [2/7] Parsing speakers...")
-        dialogues = self.diarizer.parse_transcript(raw_text)
-        patient_statements = self.diarizer.get_patient_statements(dialogues)
-        doctor_statements = self.diarizer.get_doctor_statements(dialogues)
-        dialogue_stats = self.diarizer.get_dialogue_stats(dialogues)
+        stage("diarization")
+        self._log("   [2/7] Parsing speakers...")
+        parsed = self.diarizer.parse_transcript_full(raw_text)
+        patient_statements = parsed['patient_statements']
+
+        # Independent stages in reporting order; with the executor they all
+        # start at once and are awaited in this order, so on_stage (which
+        # may touch UI state) is only ever called from this thread
+        tasks = []
+        if ner:
+            tasks.append(("ner", "   [3/7] Extracting entities...",
+                          lambda: self.ner.analyze(cleaned_text)))
+        tasks.append(("temporal", "   [4/7] Extracting temporal info...",
+                      lambda: self.temporal_extractor.extract_all_temporal(cleaned_text)))
+        if sentiment:
+            tasks.append(("sentiment", "   [5/7] Analyzing sentiment...",
+                          lambda: self.sentiment_analyzer.analyze_patient_statements(patient_statements)))
+        if intent:
+            tasks.append(("intent", "   [6/7] Classifying intents...",
+                          lambda: self.intent_classifier.classify_patient_intents(patient_statements)))
+        tasks.append(("summary", "   [7/7] Generating summary...",
+                      lambda: self.keyword_extractor.extract_keywords(cleaned_text)))
+
+        futures = {}
+        if self._executor is not None:
+            futures = {name: self._executor.submit(fn) for name, _, fn in tasks}
+
+        results = {}
+        for name, message, fn in tasks:
+            stage(name)
+            self._log(message)
+            results[name] = futures[name].result() if futures else fn()
+
+        output = self._build_output(
+            cleaned_text, parsed, results, ner=ner, sentiment=sentiment, intent=intent
+        )
+
+        self._log("✅ Processing complete!\n")
+        return output
+
+    def process_batch(
+        self,
+        raw_texts: List[str],
+        *,
+        batch_size: int = 64,
+        n_process: int = 1,
+        ner: bool = True,
+        sentiment: bool = True,
+        intent: bool = True,
+    ) -> List[Dict]:
+        """
+        Run the full pipeline on several transcripts.
+
+        Produces the same output as calling process() on each transcript,
+        but every model stage sees the whole batch at once: NER goes
+        through spaCy's nlp.pipe, keywords through one KeyBERT call, and
+        the patient statements of all transcripts are pooled into single
+        sentiment and intent passes.
+
+        Args:
+            raw_texts: Raw medical transcript texts
+            batch_size: Documents per spaCy batch
+            n_process: Worker processes for spaCy parsing
+            ner: Run entity, diagnosis and prognosis extraction
+            sentiment: Run sentiment analysis on patient statements
+            intent: Run intent classification on patient statements
 
-        print("   [3/7] Extracting entities...")
-        entities = self.ner.extract_entities(cleaned_text)
-        entities = self.entity_validator.validate_entities_dict(entities)
-        diagnosis = self.ner.extract_diagnosis(cleaned_text)
-        prognosis = self.ner.extract_prognosis(cleaned_text)
+        Returns:
+            One output dictionary per transcript, in input order; empty
+            transcripts get the same error dictionary as process()
+        """
+        valid = [i for i, text in enumerate(raw_texts) if text and text.strip()]
+        outputs = [{"error": "Empty input text"} for _ in raw_texts]
+        if not valid:
+            return outputs
+
+        self._log(f"\n🔄 Processing {len(valid)} transcripts...")
+
+        cleaned = [self.text_cleaner.clean(raw_texts[i]) for i in valid]
+        parsed = [self.diarizer.parse_transcript_full(raw_texts[i]) for i in valid]
+
+        results = [{} for _ in valid]
+
+        def scatter(name: str, values: List):
+            for result, value in zip(results, values):
+                result[name] = value
+
+        if ner:
+            scatter("ner", self.ner.analyze_batch(cleaned, batch_size=batch_size, n_process=n_process))
+        scatter("temporal", [self.temporal_extractor.extract_all_temporal(text) for text in cleaned])
+
+        # Both classifiers drop statements under three words and return one
+        # result per remaining statement, so pooling the filtered lists lets
+        # the flat results be split back by length
+        statements = [
+            [s for s in p['patient_statements'] if len(s.split()) >= 3]
+            for p in parsed
+        ]
+        pooled = [s for group in statements for s in group]
+
+        def unpool(flat: List) -> List[List]:
+            groups, start = [], 0
+            for group in statements:
+                groups.append(flat[start:start + len(group)])
+                start += len(group)
+            return groups
+
+        if sentiment:
+            scatter("sentiment", unpool(self.sentiment_analyzer.analyze_patient_statements(pooled)))
+        if intent:
+            scatter("intent", unpool(self.intent_classifier.classify_patient_intents(pooled)))
+        scatter("summary", self.keyword_extractor.extract_keywords_batch(cleaned))
+
+        for i, text, parsed_text, result in zip(valid, cleaned, parsed, results):
+            outputs[i] = self._build_output(
+                text, parsed_text, result, ner=ner, sentiment=sentiment, intent=intent
+            )
+
+        self._log("✅ Processing complete!\n")
+        return outputs
+
+    def _build_output(
+        self,
+        cleaned_text: str,
+        parsed: Dict,
+        results: Dict,
+        *,
+        ner: bool,
+        sentiment: bool,
+        intent: bool,
+    ) -> Dict:
+        """
+        Assemble the structured output for one transcript.
 
-        print("   [4/7] Extracting temporal info...")
-        temporal = self.temporal_extractor.extract_all_temporal(cleaned_text)
+        Args:
+            cleaned_text: Cleaned transcript text
+            parsed: SpeakerDiarizer.parse_transcript_full() output
+            results: Stage results keyed by stage name ("ner", "temporal",
+                "sentiment", "intent", "summary"); disabled stages absent
+            ner: Whether the NER stage was enabled
+            sentiment: Whether the sentiment stage was enabled
+            intent: Whether the intent stage was enabled
 
-        print("   [5/7] Analyzing sentiment...")
-        sentiment_results = self.sentiment_analyzer.analyze_patient_statements(patient_statements)
+        Returns:
+            Complete structured output dictionary
+        """
+        dialogues = parsed['dialogues']
+        dialogue_stats = parsed['stats']
+
+        entities = {'symptoms': [], 'treatments': [], 'diagnoses': [], 'anatomy': []}
+        diagnosis = prognosis = None
+        ner_result = results.get("ner")
+        if ner_result is not None:
+            entities = self.entity_validator.validate_entities_dict(ner_result['entities'])
+            diagnosis = ner_result['diagnosis']
+            prognosis = ner_result['prognosis']
+        else:
+            # An explicit empty result, since the summarizer runs NER
+            # itself when given None
+            ner_result = {'entities': entities, 'diagnosis': None, 'prognosis': None}
+
+        temporal = results["temporal"]
+
+        sentiment_results = results.get("sentiment", [])
         overall_sentiment = self.sentiment_analyzer.get_overall_sentiment(sentiment_results)
         sentiment_timeline = self.sentiment_analyzer.get_sentiment_timeline(sentiment_results)
 
-        print("   [6/7] Classifying intents...")
-        intent_results = self.intent_classifier.classify_patient_intents(patient_statements)
+        intent_results = results.get("intent", [])
         intent_distribution = self.intent_classifier.get_intent_distribution(intent_results)
 
-        print("   [7/7] Generating summary...")
-        keywords = self.keyword_extractor.extract_keywords(cleaned_text)
-        medical_phrases = self.keyword_extractor.extract_medical_phrases(cleaned_text)
-        summary = self.summarizer.generate_summary(cleaned_text, dialogues)
+        # One KeyBERT pass and one NER parse feed both the keyword
+        # section and the summary
+        keywords = results["summary"]
+        medical_phrases = self.keyword_extractor.select_medical_phrases(keywords)
+        summary = self.summarizer.generate_summary(
+            cleaned_text,
+            dialogues,
+            keywords=medical_phrases,
+            ner_result=ner_result,
+            temporal=temporal
+        )
 
         output = {
             "metadata": {
@@ -105,6 +337,7 @@ class MedicalNLPPipeline:
                 "total_dialogues": dialogue_stats['total_turns'],
                 "doctor_turns": dialogue_stats['doctor_turns'],
                 "patient_turns": dialogue_stats['patient_turns'],
+                "stages": {"ner": ner, "sentiment": sentiment, "intent": intent},
             },
             "summary": {
                 "patient_name": summary['patient_name'],
@@ -136,7 +369,6 @@ class MedicalNLPPipeline:
             "dialogues": dialogues,
         }
 
-        print("✅ Processing complete!\n")
         return output
 
     def save_output(self, output: Dict, filename: str = None) -> str:
@@ -156,10 +388,10 @@ class MedicalNLPPipeline:
 
         output_path = DATA_OUTPUT / filename
 
-        with open(output_path, 'w') as f:
-            json.dump(output, f, indent=OUTPUT_CONFIG['json_indent'], default=str)
+        with open(output_path, 'wb', buffering=1 << 20) as f:
+            f.write(dumps_json(output, indent=OUTPUT_CONFIG['json_indent']))
 
-        print(f"💾 Output saved to: {output_path}")
+        self._log(f"💾 Output saved to: {output_path}")
         return str(output_path)
 
     def load_transcript(self, filepath: str) -> str:
@@ -187,6 +419,7 @@ if __name__ == "__main__":
     output = pipeline.process(raw_text)
 
     saved_path = pipeline.save_output(output)
+    pipeline.close()
 
     print("=" * 60)
     print("FULL PIPELINE TEST RESULTS")
@@ -14,6 +14,21 @@ from typing import List, Dict, Optional
 from src.preprocessing.text_cleaner import TextCleaner
 
 
+# Speaker labels that open a turn
+_SPEAKER_LABEL = r'(Physician|Patient|Doctor|Dr\.?|Pt\.?)'
+
+# A speaker label at the start of a (whitespace-stripped) line, followed by
+# a colon or by whitespace and more text on that line; the separator is
+# consumed so the turn text starts right after it
+_SPEAKER_LINE_RE = re.compile(
+    r'^[^\S\n]*' + _SPEAKER_LABEL + r'(?=:|[^\S\n]+\S)(?:[^\S\n]|:)+',
+    re.IGNORECASE | re.MULTILINE
+)
+
+# Whole lines that are stage directions, e.g. "[Physical Examination Conducted]"
+_STAGE_DIRECTION_RE = re.compile(r'^[^\S\n]*\[[^\n]*\][^\S\n]*$', re.MULTILINE)
+
+
 # ============================================================================
 # SPEAKER DIARIZER CLASS
 # ============================================================================
@@ -44,7 +59,7 @@ class SpeakerDiarizer:
         # Pattern to match speaker labels
         # Matches: Physician:, Patient:, Doctor:, etc.
         self.speaker_pattern = re.compile(
-            r'^(Physician|Patient|Doctor|Dr\.?|Pt\.?)[\s:]+',
+            r'^' + _SPEAKER_LABEL + r'[\s:]+',
             re.IGNORECASE | re.MULTILINE
         )
         
@@ -56,6 +71,15 @@ class SpeakerDiarizer:
             'patient': 'patient',
             'pt': 'patient',
         }
+        
+        # Labels as they usually appear in transcripts ("Doctor", "DR.",
+        # "pt:") resolved up front, so most turns need no string work
+        self._label_map = {
+            variant + suffix: speaker
+            for label, speaker in self.speaker_mappings.items()
+            for variant in (label, label.title(), label.upper())
+            for suffix in ('', '.', ':')
+        }
     def parse_transcript(self, text: str) -> List[Dict[str, str]]:
         """
         Parse transcript into structured dialogue list.
@@ -75,54 +99,83 @@ class SpeakerDiarizer:
         if not text or not text.strip():
             return []
         
-        dialogues = []
-        lines = text.split('\n')
+        # One sweep finds every speaker line; each turn's text runs up to
+        # the next one (line breaks are collapsed by the cleaner)
+        text = _STAGE_DIRECTION_RE.sub('', text)
+        matches = list(_SPEAKER_LINE_RE.finditer(text))
+        ends = [m.start() for m in matches[1:]] + [len(text)]
         
-        current_speaker = None
-        current_text = []
+        turns = []
         
-        for line in lines:
-            line = line.strip()
-            
-            # Skip empty lines
-            if not line:
-                continue
+        for match, end in zip(matches, ends):
+            turn_text = text[match.end():end]
+            if turn_text.strip():
+                turns.append((match.group(1), turn_text))
+        
+        # All turns go through the cleaner together
+        cleaned = self.text_cleaner.clean_batch([turn_text for _, turn_text in turns])
+        
+        return [
+            {'speaker': self._normalize_speaker(label), 'text': turn_text}
+            for (label, _), turn_text in zip(turns, cleaned)
+        ]
+    def parse_transcript_full(self, text: str) -> Dict:
+        """
+        Parse a transcript and derive statements and stats in one pass.
+        
+        Equivalent to calling parse_transcript followed by
+        get_patient_statements, get_doctor_statements and
+        get_dialogue_stats, but walks the dialogue list once.
+        
+        Args:
+            text: Raw transcript text with speaker labels
             
-            # Skip stage directions (text in brackets)
-            if line.startswith('[') and line.endswith(']'):
-                continue
+        Returns:
+            Dictionary with 'dialogues', 'patient_statements',
+            'doctor_statements' and 'stats'
+        """
+        dialogues = self.parse_transcript(text)
+        if not dialogues:
+            return {
+                'dialogues': dialogues,
+                'patient_statements': [],
+                'doctor_statements': [],
+                'stats': self.get_dialogue_stats(dialogues),
+            }
+        
+        patient_statements = []
+        doctor_statements = []
+        patient_turns = doctor_turns = total_words = 0
+        
+        for d in dialogues:
+            statement = d['text']
             
-            # Check if line starts with speaker label
-            speaker_match = self.speaker_pattern.match(line)
+            # Cleaned text is stripped and single-spaced, so words can be
+            # counted without splitting and emptiness is plain truthiness
+            if statement:
+                total_words += statement.count(' ') + 1
             
-            if speaker_match:
-                # Save previous speaker's dialogue
-                if current_speaker and current_text:
-                    dialogues.append({
-                        'speaker': current_speaker,
-                        'text': self.text_cleaner.clean(' '.join(current_text))
-                    })
-                
-                # Start new speaker turn
-                speaker_label = speaker_match.group(1).lower().rstrip('.:')
-                current_speaker = self._normalize_speaker(speaker_label)
-                
-                # Get text after speaker label
-                text_after_label = line[speaker_match.end():].strip()
-                current_text = [text_after_label] if text_after_label else []
-            else:
-                # Continuation of current speaker's text
-                if current_speaker:
-                    current_text.append(line)
+            if d['speaker'] == 'patient':
+                patient_turns += 1
+                if statement:
+                    patient_statements.append(statement)
+            elif d['speaker'] == 'doctor':
+                doctor_turns += 1
+                if statement:
+                    doctor_statements.append(statement)
         
-        # Don't forget the last dialogue
-        if current_speaker and current_text:
-            dialogues.append({
-                'speaker': current_speaker,
-                'text': self.text_cleaner.clean(' '.join(current_text))
-            })
-        
-        return dialogues
+        return {
+            'dialogues': dialogues,
+            'patient_statements': patient_statements,
+            'doctor_statements': doctor_statements,
+            'stats': {
+                'total_turns': len(dialogues),
+                'doctor_turns': doctor_turns,
+                'patient_turns': patient_turns,
+                'total_words': total_words,
+                'avg_words_per_turn': total_words / len(dialogues),
+            },
+        }
     def _normalize_speaker(self, speaker_label: str) -> str:
         """
         Normalize speaker labels to standard format.
@@ -133,8 +186,12 @@ class SpeakerDiarizer:
         Returns:
             Normalized speaker name ('doctor' or 'patient')
         """
+        speaker = self._label_map.get(speaker_label)
+        if speaker is not None:
+            return speaker
+        
         # Remove common punctuation
-        speaker_label = speaker_label.lower().strip().rstrip('.:')
+        speaker_label = speaker_label.strip().lower().rstrip('.:')
         
         # Map to standard name
         return self.speaker_mappings.get(speaker_label, speaker_label)
@@ -202,10 +259,16 @@ class SpeakerDiarizer:
                 'total_words': 0,
             }
         
-        doctor_turns = sum(1 for d in dialogues if d['speaker'] == 'doctor')
-        patient_turns = sum(1 for d in dialogues if d['speaker'] == 'patient')
+        doctor_turns = patient_turns = total_words = 0
         
-        total_words = sum(len(d['text'].split()) for d in dialogues)
+        for d in dialogues:
+            speaker = d['speaker']
+            if speaker == 'doctor':
+                doctor_turns += 1
+            elif speaker == 'patient':
+                patient_turns += 1
+            
+            total_words += len(d['text'].split())
         
         return {
             'total_turns': len(dialogues),
@@ -12,6 +12,8 @@ import re
 from typing import Dict, List, Optional
 from datetime import datetime
 
+from src.utils.regex_utils import compile_regex
+
 
 class TemporalExtractor:
     """
@@ -57,9 +59,9 @@ class TemporalExtractor:
         ]
         
         self.compiled_patterns = {
-            'dates': [re.compile(p, re.IGNORECASE) for p in self.date_patterns],
-            'times': [re.compile(p, re.IGNORECASE) for p in self.time_patterns],
-            'durations': [re.compile(p, re.IGNORECASE) for p in self.duration_patterns],
+            'dates': [compile_regex(p, re.IGNORECASE) for p in self.date_patterns],
+            'times': [compile_regex(p, re.IGNORECASE) for p in self.time_patterns],
+            'durations': [compile_regex(p, re.IGNORECASE) for p in self.duration_patterns],
         }
     
     def extract_all_temporal(self, text: str) -> Dict[str, List[Dict]]:
@@ -94,23 +96,7 @@ class TemporalExtractor:
         Returns:
             List of dictionaries containing date information
         """
-        dates = []
-        seen = set()
-        
-        for pattern in self.compiled_patterns['dates']:
-            matches = pattern.finditer(text)
-            for match in matches:
-                date_text = match.group(0).strip()
-                
-                if date_text.lower() not in seen:
-                    dates.append({
-                        'text': date_text,
-                        'position': match.span(),
-                        'type': 'date'
-                    })
-                    seen.add(date_text.lower())
-        
-        return dates
+        return self._collect('dates', 'date', text)
     
     def extract_times(self, text: str) -> List[Dict]:
         """
@@ -122,23 +108,7 @@ class TemporalExtractor:
         Returns:
             List of dictionaries containing time information
         """
-        times = []
-        seen = set()
-        
-        for pattern in self.compiled_patterns['times']:
-            matches = pattern.finditer(text)
-            for match in matches:
-                time_text = match.group(0).strip()
-                
-                if time_text.lower() not in seen:
-                    times.append({
-                        'text': time_text,
-                        'position': match.span(),
-                        'type': 'time'
-                    })
-                    seen.add(time_text.lower())
-        
-        return times
+        return self._collect('times', 'time', text)
     
     def extract_durations(self, text: str) -> List[Dict]:
         """
@@ -150,23 +120,63 @@ class TemporalExtractor:
         Returns:
             List of dictionaries containing duration information
         """
-        durations = []
+        return self._collect('durations', 'duration', text)
+    
+    def _collect(self, category: str, item_type: str, text: str) -> List[Dict]:
+        """
+        Run one category's patterns over text, keeping first occurrences.
+        
+        Each pattern is scanned separately on purpose: the patterns
+        overlap (e.g. "through 10" as a date and "10 sessions" as a
+        duration), and a fused alternation would let one consume text
+        another needs.
+        
+        Args:
+            category: Key into compiled_patterns
+            item_type: Value for each result's 'type' field
+            text: Input text
+            
+        Returns:
+            List of dictionaries with text, position and type
+        """
+        items = []
         seen = set()
         
-        for pattern in self.compiled_patterns['durations']:
-            matches = pattern.finditer(text)
-            for match in matches:
-                duration_text = match.group(0).strip()
+        for pattern in self.compiled_patterns[category]:
+            for match in pattern.finditer(text):
+                item_text = match.group(0).strip()
+                key = item_text.lower()
                 
-                if duration_text.lower() not in seen:
-                    durations.append({
-                        'text': duration_text,
+                if key not in seen:
+                    seen.add(key)
+                    items.append({
+                        'text': item_text,
                         'position': match.span(),
-                        'type': 'duration'
+                        'type': item_type
                     })
-                    seen.add(duration_text.lower())
         
-        return durations
+        return items
+    
+    def _first(self, category: str, text: str) -> Optional[str]:
+        """
+        Return the first item _collect would produce for a category.
+        
+        Patterns are tried in order and each stops at its first hit,
+        so the rest of the text is never scanned.
+        
+        Args:
+            category: Key into compiled_patterns
+            text: Input text
+            
+        Returns:
+            Matched text, or None if no pattern matches
+        """
+        for pattern in self.compiled_patterns[category]:
+            match = pattern.search(text)
+            if match:
+                return match.group(0).strip()
+        
+        return None
     
     def extract_incident_date(self, text: str) -> Optional[str]:
         """
@@ -178,8 +188,7 @@ class TemporalExtractor:
         Returns:
             First date found, or None if no date present
         """
-        dates = self.extract_dates(text)
-        return dates[0]['text'] if dates else None
+        return self._first('dates', text)
     
     def extract_treatment_duration(self, text: str) -> Optional[str]:
         """
@@ -191,8 +200,7 @@ class TemporalExtractor:
         Returns:
             First duration found, or None if no duration present
         """
-        durations = self.extract_durations(text)
-        return durations[0]['text'] if durations else None
+        return self._first('durations', text)
     
     def get_temporal_summary(self, text: str) -> Dict:
         """
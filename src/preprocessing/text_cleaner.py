@@ -9,9 +9,56 @@ Date: February 2026
 """
 
 import re
-from typing import Dict, Optional
+import threading
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, Optional
 
 from src.config import MEDICAL_ABBREVIATIONS
+from src.utils.regex_utils import compile_regex
+
+
+# Character-level cleanup applied in one translate pass: markdown emphasis
+# markers are dropped and typographic punctuation mapped to ASCII
+_CHAR_TABLE = str.maketrans({
+    '*': None,
+    '—': '-',
+    '–': '-',
+    '…': '...',
+    '\u201c': '"',
+    '\u201d': '"',
+    '\u2018': "'",
+    '\u2019': "'",
+})
+
+# Compiled once at import and shared by every TextCleaner (RE2 when enabled)
+_PATTERNS = {
+    'extra_spaces': compile_regex(r'\s+'),
+    'markdown': compile_regex(r'\*+'),
+    'speaker_tags': compile_regex(r'\*\*(.*?)\*\*:'),
+}
+
+# Read-only snapshot of the config table; the regex and expansion list
+# below are derived from it once, so it must not change afterwards
+_ABBREVIATIONS = MappingProxyType(dict(MEDICAL_ABBREVIATIONS))
+
+# All abbreviations in one alternation, one group each; alternatives keep
+# dict order so the same key wins as when each was applied in turn, and the
+# matched group's index picks the expansion (no case folding of the matched
+# text needed). Alternatives are escaped literals with no quantifiers, so a
+# failed attempt costs at most one comparison per abbreviation and the scan
+# stays linear in the text
+_ABBREVIATION_RE = compile_regex(
+    r'\b(?:%s)\b' % '|'.join('(%s)' % re.escape(abbr) for abbr in _ABBREVIATIONS),
+    re.IGNORECASE
+)
+_EXPANSIONS = tuple(_ABBREVIATIONS.values())
+
+# Joins texts in clean_batch; not whitespace, not a word character, never
+# produced by normalization, so every step leaves it in place
+_BATCH_SEP = '\x00'
 
 
 # ============================================================================
@@ -33,17 +80,26 @@ class TextCleaner:
         >>> clean_text = cleaner.clean(text)
     """
     
+    # Cleaned results kept per instance; transcripts repeat short turns
+    # ("Yes.", "Okay.") and the pipeline re-cleans the same text
+    _CACHE_SIZE = 2048
+    # Whole transcripts are cleaned once and would only crowd out turns
+    _CACHE_MAX_CHARS = 10_000
+    
     def __init__(self):
         """Initialize the text cleaner with regex patterns."""
-        # Compile regex patterns for efficiency
-        self.patterns = {
-            'extra_spaces': re.compile(r'\s+'),
-            'markdown': re.compile(r'\*+'),
-            'speaker_tags': re.compile(r'\*\*(.*?)\*\*:'),
-        }
+        # Regex patterns (shared, compiled at import)
+        self.patterns = _PATTERNS
         
         # Medical abbreviations from config
-        self.abbreviations = MEDICAL_ABBREVIATIONS
+        self.abbreviations = _ABBREVIATIONS
+        self._abbreviation_re = _ABBREVIATION_RE
+        self._expansions = _EXPANSIONS
+        
+        self._cache: Dict[str, str] = {}
+        # Lookups are atomic dict.get calls; eviction and insertion are
+        # locked since a cleaner may be shared by app session threads
+        self._cache_lock = threading.Lock()
     def clean(self, text: str) -> str:
         """
         Apply all cleaning operations to text.
@@ -62,61 +118,138 @@ class TextCleaner:
         if not text or not text.strip():
             return ""
         
-        # Apply cleaning steps in order
-        text = self._remove_markdown(text)
-        text = self._normalize_whitespace(text)
-        text = self._normalize_punctuation(text)
-        text = self._expand_abbreviations(text)
+        cached = self._cache.get(text)
+        if cached is not None:
+            return cached
         
-        return text.strip()
-    def _remove_markdown(self, text: str) -> str:
+        # Fold compatibility characters (ligatures, full-width forms, NBSP)
+        # so equivalent spellings look the same to every later step
+        normalized = text
+        if not unicodedata.is_normalized('NFKC', normalized):
+            normalized = unicodedata.normalize('NFKC', normalized)
+        
+        # Markdown, punctuation and whitespace are handled by two C-level
+        # passes (split() collapses and strips the same characters as \s)
+        cleaned = ' '.join(normalized.translate(_CHAR_TABLE).split())
+        cleaned = self._expand_abbreviations(cleaned)
+        
+        self._remember(text, cleaned)
+        
+        return cleaned
+    
+    def clean_batch(self, texts: List[str], n_process: int = 1) -> List[str]:
         """
-        Remove markdown formatting artifacts.
+        Clean several texts at once.
+        
+        Gives the same results as calling clean() on each text, but runs
+        normalization, translation and abbreviation expansion once over
+        all uncached texts joined together instead of once per text.
         
         Args:
-            text: Text with potential markdown
+            texts: Raw transcription texts
+            n_process: Worker processes; above 1 the uncached texts are
+                split into chunks cleaned in parallel (worth it only for
+                large corpora, since texts are pickled to the workers)
             
         Returns:
-            Text without markdown symbols
+            Cleaned texts in input order
         """
-        # Remove ** around speaker names and emphasis
-        text = self.patterns['markdown'].sub('', text)
-        return text
+        done = {}
+        pending = []
+        for text in dict.fromkeys(texts):
+            cached = self._cache.get(text)
+            if cached is not None:
+                done[text] = cached
+            elif not text or not text.strip():
+                done[text] = ""
+            else:
+                pending.append(text)
+        
+        if n_process > 1 and len(pending) > 1:
+            # A few chunks per worker keeps them busy without paying
+            # per-text IPC
+            size = -(-len(pending) // (n_process * 4))
+            chunks = [pending[i:i + size] for i in range(0, len(pending), size)]
+            with ProcessPoolExecutor(max_workers=n_process) as pool:
+                cleaned_chunks = pool.map(partial(_clean_chunk, type(self)), chunks)
+                results = [cleaned for chunk in cleaned_chunks for cleaned in chunk]
+        else:
+            results = self._clean_joined(pending)
+        
+        for text, cleaned in zip(pending, results):
+            self._remember(text, cleaned)
+            done[text] = cleaned
+        
+        return [done[text] for text in texts]
     
-    def _normalize_whitespace(self, text: str) -> str:
+    def clean_stream(self, chunks: Iterable[str]) -> Iterator[str]:
         """
-        Normalize all whitespace to single spaces.
+        Clean text that arrives in chunks, e.g. lines read from a file.
+        
+        Every cleaning step is local to whitespace-separated words, so
+        everything up to the last space or newline seen so far is cleaned
+        and yielded right away; only a trailing partial word is held back.
+        Joining the yielded pieces with single spaces gives the same
+        result as clean() on the whole text.
         
         Args:
-            text: Text with irregular whitespace
+            chunks: Pieces of raw transcription text, in order
             
-        Returns:
-            Text with normalized spacing
+        Yields:
+            Non-empty cleaned pieces
         """
-        # Replace multiple spaces/tabs/newlines with single space
-        text = self.patterns['extra_spaces'].sub(' ', text)
-        return text
-    def _normalize_punctuation(self, text: str) -> str:
+        pending = ''
+        for chunk in chunks:
+            pending += chunk
+            cut = max(pending.rfind(' '), pending.rfind('\n'))
+            if cut > 0:
+                cleaned = self.clean(pending[:cut])
+                pending = pending[cut:]
+                if cleaned:
+                    yield cleaned
+        
+        cleaned = self.clean(pending)
+        if cleaned:
+            yield cleaned
+    
+    def _clean_joined(self, texts: List[str]) -> List[str]:
         """
-        Normalize punctuation marks.
+        Clean non-empty texts in one pass over their concatenation.
         
         Args:
-            text: Text with various punctuation
+            texts: Raw, non-blank texts
             
         Returns:
-            Text with normalized punctuation
+            Cleaned texts in input order
         """
-        # Normalize different dash types
-        text = text.replace('—', '-').replace('–', '-')
+        if len(texts) <= 1 or any(_BATCH_SEP in text for text in texts):
+            return [self.clean(text) for text in texts]
         
-        # Normalize ellipsis
-        text = text.replace('…', '...')
+        joined = _BATCH_SEP.join(texts)
+        if not unicodedata.is_normalized('NFKC', joined):
+            joined = unicodedata.normalize('NFKC', joined)
         
-        # Normalize quotes
-        text = text.replace('"', '"').replace('"', '"')
-        text = text.replace(''', "'").replace(''', "'")
+        joined = _BATCH_SEP.join(
+            ' '.join(part.split())
+            for part in joined.translate(_CHAR_TABLE).split(_BATCH_SEP)
+        )
         
-        return text
+        return self._expand_abbreviations(joined).split(_BATCH_SEP)
+    
+    def _remember(self, text: str, cleaned: str):
+        """
+        Store a cleaned result in the per-instance cache.
+        
+        Args:
+            text: Raw input text
+            cleaned: Its cleaned form
+        """
+        if len(text) <= self._CACHE_MAX_CHARS:
+            with self._cache_lock:
+                if len(self._cache) >= self._CACHE_SIZE:
+                    # Evict the oldest entry (dicts keep insertion order)
+                    del self._cache[next(iter(self._cache))]
+                self._cache[text] = cleaned
     
     def _expand_abbreviations(self, text: str) -> str:
         """
@@ -128,12 +261,12 @@ class TextCleaner:
         Returns:
             Text with expanded abbreviations
         """
-        for abbr, expansion in self.abbreviations.items():
-            # Use word boundaries to avoid partial matches
-            pattern = rf'\b{re.escape(abbr)}\b'
-            text = re.sub(pattern, expansion, text, flags=re.IGNORECASE)
+        if not self._expansions:
+            return text
         
-        return text
+        return self._abbreviation_re.sub(
+            lambda match: self._expansions[match.lastindex - 1], text
+        )
     def clean_for_display(self, text: str, max_length: int = 100) -> str:
         """
         Clean text and truncate for display purposes.
@@ -145,12 +278,31 @@ class TextCleaner:
         Returns:
             Cleaned and truncated text
         """
+        # Every cleaning step is local to whitespace-separated words (the
+        # abbreviations are single words), so a head cut at whitespace
+        # cleans to a prefix of the full result; long texts only clean that
+        limit = max_length * 4
+        if 0 < limit < len(text):
+            head = text[:limit]
+            cut = max(head.rfind(' '), head.rfind('\n'))
+            if cut > 0:
+                cleaned = self.clean(head[:cut])
+                if len(cleaned) > max_length:
+                    return cleaned[:max_length] + "..."
+        
         cleaned = self.clean(text)
         
         if len(cleaned) > max_length:
             return cleaned[:max_length] + "..."
         
         return cleaned
+
+
+def _clean_chunk(cleaner_cls: type, texts: List[str]) -> List[str]:
+    """Clean one clean_batch chunk in a worker process."""
+    return cleaner_cls()._clean_joined(texts)
+
+
 # ============================================================================
 # TESTING
 # ============================================================================
@@ -0,0 +1,7 @@
+"""Shared utilities for the Medical NLP System."""
+
+from .model_utils import quantize_pipeline, run_length_sorted
+from .regex_utils import compile_regex
+from .json_utils import dumps_json
+
+__all__ = ['quantize_pipeline', 'run_length_sorted', 'compile_regex', 'dumps_json']
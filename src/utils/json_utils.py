@@ -0,0 +1,38 @@
+"""
+JSON serialization helpers shared by the pipeline and the app downloads.
+
+Author: Koushik
+Date: February 2026
+"""
+
+import json
+from typing import Any, Optional
+
+import orjson
+
+# Accept non-str dict keys and NumPy values, and pass datetimes to str() so
+# both branches of dumps_json render them the same way
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME
+)
+
+
+def dumps_json(obj: Any, indent: Optional[int] = 2) -> bytes:
+    """
+    Serialize an object to UTF-8 JSON bytes.
+
+    Uses orjson for no or 2-space indentation, the only widths it
+    supports, and the standard library for any other width.
+
+    Args:
+        obj: Object to serialize
+        indent: Indentation width (None or 0 for compact output)
+
+    Returns:
+        Encoded JSON document
+    """
+    if indent in (None, 0, 2):
+        option = _ORJSON_OPTIONS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, default=str, option=option)
+
+    return json.dumps(obj, indent=indent, default=str, ensure_ascii=False).encode('utf-8')
@@ -0,0 +1,42 @@
+"""
+Regex compilation helpers shared across preprocessing components.
+
+Author: Koushik
+Date: February 2026
+"""
+
+import re
+
+from src.config import PROCESSING_CONFIG
+
+
+def compile_regex(pattern: str, flags: int = 0):
+    """
+    Compile a pattern, using google-re2 when enabled and available.
+
+    RE2 scans in linear time with a DFA instead of backtracking. It is
+    only used for patterns it accepts and when the only flag is
+    IGNORECASE; note that its \\d, \\w and \\s classes are ASCII-only.
+    Otherwise, or if the optional google-re2 package is missing, the
+    standard library engine is used.
+
+    Args:
+        pattern: Regular expression source
+        flags: re module flags
+
+    Returns:
+        Compiled pattern exposing search/finditer/sub
+    """
+    if PROCESSING_CONFIG['use_re2'] and not flags & ~re.IGNORECASE:
+        try:
+            import re2
+        except ImportError:
+            re2 = None
+
+        if re2 is not None:
+            try:
+                return re2.compile(('(?i)' if flags & re.IGNORECASE else '') + pattern)
+            except Exception:
+                pass
+
+    return re.compile(pattern, flags)
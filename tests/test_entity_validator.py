@@ -0,0 +1,58 @@
+"""Unit tests for EntityValidator."""
+import pytest
+from src.models.ner import EntityValidator
+
+def test_validate_entity():
+    """Test stop words, digit-only and punctuation-only entities are rejected."""
+    validator = EntityValidator()
+
+    assert validator.validate_entity('x-ray')
+    assert validator.validate_entity('12a')
+    assert not validator.validate_entity(' The ')
+    assert not validator.validate_entity('123')
+    assert not validator.validate_entity('?!')
+    assert not validator.validate_entity('a')
+
+def test_remove_substrings_is_case_insensitive():
+    """Test shorter entities inside longer ones are removed regardless of case."""
+    validator = EntityValidator()
+    entities = ['pain', 'Neck Pain', 'NECK', 'back']
+
+    assert validator.remove_substrings(entities) == ['Neck Pain', 'back']
+
+def test_remove_substrings_with_punctuation():
+    """Test entities containing punctuation are matched literally."""
+    validator = EntityValidator()
+    entities = ['a&e', 'x-ray', 'A&E visit', 'x-ray (chest)', 'ray']
+
+    assert validator.remove_substrings(entities) == ['x-ray (chest)', 'A&E visit']
+
+def test_remove_substrings_keeps_order_and_equal_entities():
+    """Test longest-first order, stable ties, and no matches across kept entities."""
+    validator = EntityValidator()
+    entities = ['painback', 'back ache', 'Neck Pain', 'neck pain']
+
+    assert validator.remove_substrings(entities) == [
+        'back ache', 'Neck Pain', 'neck pain', 'painback'
+    ]
+    assert validator.remove_substrings([]) == []
+
+def test_merge_similar_entities_is_case_insensitive():
+    """Test the first spelling of a repeated entity is kept, in input order."""
+    validator = EntityValidator()
+    entities = ['Neck Pain', 'back pain', 'neck pain', 'headache']
+
+    assert validator.merge_similar_entities(entities) == ['Neck Pain', 'back pain', 'headache']
+
+def test_merge_similar_entities_threshold_boundary():
+    """Test entities merge only when Jaccard similarity exceeds the threshold."""
+    validator = EntityValidator()
+    # Four shared tokens out of five: Jaccard similarity of exactly 0.8
+    entities = ['severe neck pain since', 'severe neck pain since accident']
+
+    assert validator.merge_similar_entities(entities, 0.8) == entities
+    assert validator.merge_similar_entities(entities, 0.75) == entities[:1]
+    assert validator.merge_similar_entities(['neck', 'back', 'hip'], -1) == ['neck']
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])
@@ -1,6 +1,6 @@
 """Unit tests for NER module."""
 import pytest
-from src.models.ner import ScispaCyNER
+from src.models.ner import ScispaCyNER, scispacy_ner
 
 def test_ner_initialization():
     """Test NER initializes successfully."""
@@ -26,5 +26,32 @@ def test_extract_diagnosis():
     assert diagnosis is not None
     assert 'whiplash' in diagnosis.lower()
 
+def test_extract_entities_batch():
+    """Test batch extraction matches single-text extraction."""
+    ner = ScispaCyNER()
+    texts = ["Patient has neck pain and received physiotherapy", "", "Mild back pain"]
+    results = ner.extract_entities_batch(texts)
+    
+    assert len(results) == 3
+    assert results[0] == ner.extract_entities(texts[0])
+    assert results[1]['symptoms'] == []
+    assert results[2] == ner.extract_entities(texts[2])
+
+def test_rule_keywords_overlapping_phrases(monkeypatch):
+    """Test multi-word keywords are found when they overlap or nest."""
+    phrases = ['neck pain', 'pain relief', 'lower back pain', 'back pain']
+    monkeypatch.setattr(scispacy_ner, 'SYMPTOM_KEYWORDS', phrases)
+    monkeypatch.setattr(scispacy_ner, 'TREATMENT_KEYWORDS', [])
+    monkeypatch.setattr(scispacy_ner, '_RULE_KEYWORDS', set(phrases))
+    monkeypatch.setattr(scispacy_ner, '_PHRASE_KEYWORD_RES', scispacy_ner._compile_phrase_keywords(phrases))
+    
+    ner = ScispaCyNER()
+    entities = ner._enhance_with_rules(
+        "Neck pain relief came before the lower back pain",
+        {'symptoms': [], 'treatments': []}
+    )
+    
+    assert entities['symptoms'] == phrases
+
 if __name__ == "__main__":
     pytest.main([__file__, '-v'])
\ No newline at end of file
@@ -0,0 +1,71 @@
+"""Unit tests for SpeakerDiarizer."""
+import pytest
+from src.preprocessing import SpeakerDiarizer
+
+def test_parse_basic_turns():
+    """Test each speaker line opens a normalized turn."""
+    diarizer = SpeakerDiarizer()
+    text = "Physician: Good morning.\nPatient: Morning, doctor.\nDr. Smith: Sit down."
+
+    assert diarizer.parse_transcript(text) == [
+        {'speaker': 'doctor', 'text': 'Good morning.'},
+        {'speaker': 'patient', 'text': 'Morning, doctor.'},
+        {'speaker': 'doctor', 'text': 'Smith: Sit down.'},
+    ]
+    assert diarizer.parse_transcript("   \n ") == []
+
+def test_parse_skips_stage_directions():
+    """Test whole-line bracketed directions are dropped, inline ones kept."""
+    diarizer = SpeakerDiarizer()
+    text = (
+        "Doctor: Let me check.\n"
+        "  [Physical Examination Conducted]  \n"
+        "[Pause] [Notes taken]\n"
+        "Patient: [laughs] That tickles."
+    )
+
+    assert diarizer.parse_transcript(text) == [
+        {'speaker': 'doctor', 'text': 'Let me check.'},
+        {'speaker': 'patient', 'text': '[laughs] That tickles.'},
+    ]
+
+def test_parse_joins_continuation_lines():
+    """Test unlabelled lines continue the current turn."""
+    diarizer = SpeakerDiarizer()
+    text = "Patient: The pain started\n  in my neck\n\nand moved down.\nDoctor: I see."
+
+    assert diarizer.parse_transcript(text) == [
+        {'speaker': 'patient', 'text': 'The pain started in my neck and moved down.'},
+        {'speaker': 'doctor', 'text': 'I see.'},
+    ]
+
+def test_parse_label_only_lines():
+    """Test a bare 'Label:' line takes the following lines, a bare word does not."""
+    diarizer = SpeakerDiarizer()
+    text = "Doctor:\nHow are you?\nPatient:\nDoctor: Anything else?\nPatient\nNo."
+
+    assert diarizer.parse_transcript(text) == [
+        {'speaker': 'doctor', 'text': 'How are you?'},
+        {'speaker': 'doctor', 'text': 'Anything else? Patient No.'},
+    ]
+
+def test_parse_drops_text_before_first_label():
+    """Test preamble before the first speaker label is not attributed."""
+    diarizer = SpeakerDiarizer()
+    text = "Transcript of visit\n12 March\nDoctor: Hello.\nPatients are seen in order."
+
+    assert diarizer.parse_transcript(text) == [
+        {'speaker': 'doctor', 'text': 'Hello. Patients are seen in order.'},
+    ]
+
+def test_parse_mixed_case_labels():
+    """Test labels are matched and normalized regardless of case."""
+    diarizer = SpeakerDiarizer()
+    text = "DOCTOR: One.\npatient: Two.\nPt. three.\nDR: Four.\npHySiCiAn: Five."
+
+    assert [d['speaker'] for d in diarizer.parse_transcript(text)] == [
+        'doctor', 'patient', 'patient', 'doctor', 'doctor'
+    ]
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,69 @@
+"""Unit tests for TextCleaner."""
+import re
+
+import pytest
+from src.preprocessing import TextCleaner
+from src.preprocessing.text_cleaner import _ABBREVIATION_RE
+
+def test_clean_basic():
+    """Test markdown, whitespace and abbreviation cleanup."""
+    cleaner = TextCleaner()
+    text = "**Patient:**  I went to  A&E\n yesterday, pt had high BP…"
+    
+    assert cleaner.clean(text) == (
+        "Patient: I went to Accident and Emergency yesterday, "
+        "patient had high blood pressure..."
+    )
+    assert cleaner.clean("   ") == ""
+
+def test_clean_batch_matches_clean():
+    """Test batch cleaning matches single-text cleaning."""
+    cleaner = TextCleaner()
+    texts = ["Dr  said **rest**", "", "pt\x00dx", "Dr  said **rest**", "ＢＰ is fine"]
+    
+    assert cleaner.clean_batch(texts) == [TextCleaner().clean(t) for t in texts]
+
+def test_clean_stream_matches_clean():
+    """Test streamed cleaning joins back to the full result."""
+    cleaner = TextCleaner()
+    text = "Patient:  my hx of  neck pain, tx with physio "
+    chunks = [text[i:i + 7] for i in range(0, len(text), 7)]
+    
+    assert ' '.join(cleaner.clean_stream(chunks)) == cleaner.clean(text)
+
+def test_abbreviation_pattern_has_no_quantifiers():
+    """Test the abbreviation alternation is plain literals, so it cannot backtrack."""
+    pattern = _ABBREVIATION_RE.pattern
+    if pattern.startswith('(?i)'):  # RE2 carries the flag inline
+        pattern = pattern[len('(?i)'):]
+    
+    assert pattern.startswith(r'\b(?:') and pattern.endswith(r')\b')
+    # Drop escaped characters; no unescaped quantifier may remain
+    body = re.sub(r'\\.', '', pattern[len(r'\b(?:'):-len(r')\b')])
+    
+    assert not set('*+?{') & set(body)
+
+@pytest.mark.parametrize("text", [
+    "A" * 10_000,
+    "pt" * 10_000,
+    "A&" * 10_000,
+    "r" + "x" * 10_000,
+    " ".join(["re"] * 5_000),
+])
+def test_abbreviation_pass_is_single_sweep(text):
+    """Test near-miss inputs are expanded in one regex pass."""
+    calls = []
+    
+    class CountingPattern:
+        def sub(self, repl, string):
+            calls.append(len(string))
+            return _ABBREVIATION_RE.sub(repl, string)
+    
+    cleaner = TextCleaner()
+    cleaner._abbreviation_re = CountingPattern()
+    cleaner.clean(text)
+    
+    assert len(calls) == 1
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])